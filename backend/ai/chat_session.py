@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Message:
     role: str
     content: str
@@ -14,18 +15,21 @@ class Message:
 class ChatSession:
     def __init__(self, system_prompt: str, max_turns: int = 10) -> None:
         self._system = Message(role="system", content=system_prompt)
-        self._history: list[Message] = []
-        self._max_turns = max_turns
+        # Only the last max_turns exchanges are ever sent, so drop older
+        # messages on append instead of keeping the whole conversation.
+        # max_turns <= 0 keeps the full history.
+        self._history: deque[Message] = deque(
+            maxlen=max_turns * 2 if max_turns > 0 else None
+        )
 
     def add(self, role: str, content: str) -> None:
         self._history.append(Message(role=role, content=content))
 
     def build_messages(self, user_content: str) -> list[dict]:
         """Assemble a complete messages list for provider.chat()."""
-        recent = self._history[-(self._max_turns * 2):]
         return (
             [{"role": "system", "content": self._system.content}]
-            + [{"role": m.role, "content": m.content} for m in recent]
+            + [{"role": m.role, "content": m.content} for m in self._history]
             + [{"role": "user", "content": user_content}]
         )
 
@@ -3,19 +3,27 @@ PyWebView API Bridge - Exposes Python backend to JavaScript frontend.
 """
 
 import hashlib
+import json
 import os
+import pathlib
 import tempfile
 import shutil
 from typing import Optional
 import subprocess
 import threading
 import time
+import urllib.request
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from importlib.metadata import version
 
 from .pdf_engine import PDFEngine
 from .engine_factory import create_engine
 from .ai import AIService
 from .ai.tools import NoteReadTool, NoteDeleteTool, DocumentSearchTool
 from .persistence import PersistenceStore
+from .render_cache import DiskRenderCache, default_cache_dir
 
 
 class DeepReadAPI:
@@ -51,6 +59,12 @@ class DeepReadAPI:
             "error": "",
         }
 
+        # Rendered pages persisted across sessions, in the platform cache dir
+        cache_dir = os.getenv("DEEPREAD_CACHE_DIR")
+        self._disk_cache = DiskRenderCache(
+            pathlib.Path(cache_dir) if cache_dir else default_cache_dir() / "render_cache"
+        )
+
         # Local persistence (session state, recent files, page notes)
         self._persistence: Optional[PersistenceStore] = None
         self._persistence_error: Optional[str] = None
@@ -101,6 +115,10 @@ class DeepReadAPI:
 
     @staticmethod
     def _compute_file_fingerprint(file_path: str) -> str:
+        # Content-only key for persisted OCR results. Unlike the engines'
+        # mtime-sensitive content_id (used for render caches), this survives
+        # touch, copy, backup restore and sync, and must stay stable so
+        # existing OCR rows keep matching.
         size = os.path.getsize(file_path)
         with open(file_path, "rb") as f:
             head = f.read(8192)
@@ -127,7 +145,7 @@ class DeepReadAPI:
                 self.pdf_engine.close()
                 self._cleanup_ocr()
 
-            self.pdf_engine = create_engine(normalized_path)
+            self.pdf_engine = create_engine(normalized_path, disk_cache=self._disk_cache)
             self.current_pdf_path = normalized_path
 
             # 计算文件指纹，预加载 OCR 缓存
@@ -161,6 +179,13 @@ class DeepReadAPI:
                 session_state = self._persistence.get_session_state(normalized_path)
                 page_notes = self._persistence.list_page_notes(normalized_path)
 
+            # Size of the page the viewer opens on, so it can fit to width
+            # before the first render instead of rendering twice.
+            page_width = page_height = None
+            if metadata["page_count"] > 0:
+                first_page = min(max(int(session_state.get("last_page") or 1), 1), metadata["page_count"])
+                page_width, page_height = self.pdf_engine.get_page_size(first_page)
+
             return {
                 "success": True,
                 "file_path": normalized_path,
@@ -170,6 +195,8 @@ class DeepReadAPI:
                 "metadata": metadata,
                 "session_state": session_state,
                 "page_notes": page_notes,
+                "page_width": page_width,
+                "page_height": page_height,
                 "supports_ocr": isinstance(self.pdf_engine, PDFEngine),
                 "ocr_cached_pages": sorted(self._ocr_cache.keys()),
             }
@@ -197,6 +224,10 @@ class DeepReadAPI:
             image_data = self.pdf_engine.render_page(page_num, zoom)
             page_size = self.pdf_engine.get_page_size(page_num)
 
+            # Warm the neighbours so sequential paging hits the render cache
+            if isinstance(self.pdf_engine, PDFEngine):
+                self.pdf_engine.prefetch_pages([page_num + 1, page_num - 1], zoom)
+
             return {
                 "success": True,
                 "image_data": image_data,
@@ -825,15 +856,15 @@ class DeepReadAPI:
         try:
             # Generate new ID if needed
             if not note_id:
-                import uuid
                 note_id = str(uuid.uuid4())[:8]
 
+            timestamp = self._get_timestamp()
             self.notes[note_id] = {
                 "id": note_id,
                 "title": title,
                 "content": content,
-                "created_at": self._get_timestamp(),
-                "updated_at": self._get_timestamp(),
+                "created_at": timestamp,
+                "updated_at": timestamp,
             }
 
             self.current_note_id = note_id
@@ -990,15 +1021,15 @@ if ($dialog.ShowDialog() -eq [System.Windows.Forms.DialogResult]::OK) {
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def _get_version(self) -> str:
-        """Read version from package metadata or pyproject.toml."""
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_version() -> str:
+        """Read version from package metadata or pyproject.toml (once per process)."""
         try:
-            from importlib.metadata import version
             return version("deepread-ai")
         except Exception:
             pass
         try:
-            import pathlib
             toml_path = pathlib.Path(__file__).parent.parent / "pyproject.toml"
             for line in toml_path.read_text().splitlines():
                 if line.startswith("version"):
@@ -1007,6 +1038,47 @@ if ($dialog.ShowDialog() -eq [System.Windows.Forms.DialogResult]::OK) {
             pass
         return "0.1.0"
 
+    def batch(self, calls: Optional[list] = None) -> dict:
+        """
+        Run several API calls in one bridge round-trip.
+
+        Args:
+            calls: List of {"method": name, "args": [...]} dicts
+
+        Returns:
+            Dict with one result per call, in order. A failing call yields
+            its own error result without aborting the rest.
+        """
+        if not isinstance(calls, list):
+            return {"success": False, "error": "calls must be a list"}
+
+        results = []
+        for call in calls:
+            if not isinstance(call, dict):
+                results.append({"success": False, "error": "Invalid call"})
+                continue
+            name = call.get("method")
+            args = call.get("args")
+            if args is None:
+                args = []
+            elif not isinstance(args, (list, tuple)):
+                results.append({"success": False, "error": "args must be a list"})
+                continue
+            if (
+                not isinstance(name, str)
+                or name.startswith("_")
+                or name == "batch"
+                or not callable(getattr(self, name, None))
+            ):
+                results.append({"success": False, "error": f"Unknown method: {name}"})
+                continue
+            try:
+                results.append(getattr(self, name)(*args))
+            except Exception as e:
+                results.append({"success": False, "error": str(e)})
+
+        return {"success": True, "results": results}
+
     def get_app_info(self) -> dict:
         """Get application information."""
         return {
@@ -1017,9 +1089,6 @@ if ($dialog.ShowDialog() -eq [System.Windows.Forms.DialogResult]::OK) {
 
     def check_for_updates(self) -> dict:
         """Check GitHub releases for a newer version."""
-        import urllib.request
-        import json
-
         try:
             current_version = self._get_version()
             url = "https://api.github.com/repos/silenceboat/BetterPDF/releases/latest"
@@ -1056,5 +1125,4 @@ if ($dialog.ShowDialog() -eq [System.Windows.Forms.DialogResult]::OK) {
 
     def _get_timestamp(self) -> str:
         """Get current timestamp string."""
-        from datetime import datetime
         return datetime.now().isoformat()
@@ -11,6 +11,8 @@ from typing import Dict, List, Optional, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
 
+from .render_cache import SHARED_RENDER_CACHE, file_content_id
+
 
 # Style map: style_name_prefix -> (font_size, bold, space_after_px)
 STYLE_MAP = {
@@ -31,7 +33,7 @@ MARGIN_BOTTOM = 55
 LINE_HEIGHT_RATIO = 1.4
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _RenderedLine:
     text: str
     y_offset: float  # absolute y position within page
@@ -39,14 +41,14 @@ class _RenderedLine:
     bold: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class _PageRecord:
     lines: List[_RenderedLine] = field(default_factory=list)
     para_start: int = 0  # inclusive index into _paragraphs
     para_end: int = 0    # exclusive index into _paragraphs
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _ParagraphInfo:
     text: str
     font_size: int
@@ -70,7 +72,7 @@ class DocxEngine:
         self._paragraphs: List[_ParagraphInfo] = []
         self._page_records: List[_PageRecord] = []
         self._font_cache: Dict[Tuple[int, bool], ImageFont.FreeTypeFont] = {}
-        self._render_cache: Dict[Tuple[int, float], str] = {}
+        self.content_id = file_content_id(file_path)
 
         self._load_paragraphs()
         self._load_fonts()
@@ -299,9 +301,10 @@ class DocxEngine:
         Returns:
             Base64-encoded PNG string (without data URI prefix)
         """
-        cache_key = (page_num, round(zoom, 2))
-        if cache_key in self._render_cache:
-            return self._render_cache[cache_key]
+        cache_key = (self.content_id, page_num, round(zoom, 2))
+        cached = SHARED_RENDER_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
 
         if page_num < 1 or page_num > self.page_count:
             raise ValueError(f"Invalid page number: {page_num}")
@@ -325,7 +328,7 @@ class DocxEngine:
         img.save(buffer, format="PNG", optimize=True)
         img_str = base64.b64encode(buffer.getvalue()).decode()
 
-        self._render_cache[cache_key] = img_str
+        SHARED_RENDER_CACHE.put(cache_key, img_str)
         return img_str
 
     def _get_scaled_font(self, base_size: int, bold: bool, scaled_size: int) -> ImageFont.FreeTypeFont:
@@ -413,7 +416,6 @@ class DocxEngine:
 
     def close(self):
         """Free resources."""
-        self._render_cache.clear()
         self._font_cache.clear()
 
     def __enter__(self):
@@ -3,19 +3,19 @@ Engine factory - returns the appropriate document engine based on file extension
 """
 
 from pathlib import Path
+from typing import Optional
 
 from .pdf_engine import PDFEngine
-from .txt_engine import TextEngine
-from .docx_engine import DocxEngine
-from .pptx_engine import PptxEngine
+from .render_cache import DiskRenderCache
 
 
-def create_engine(file_path: str):
+def create_engine(file_path: str, disk_cache: Optional[DiskRenderCache] = None):
     """
     Create and return the appropriate document engine for the given file.
 
     Args:
         file_path: Path to the document file
+        disk_cache: Optional persistent render cache (used for PDFs)
 
     Returns:
         PDFEngine, DocxEngine, TextEngine, or PptxEngine instance
@@ -25,16 +25,20 @@ def create_engine(file_path: str):
     """
     ext = Path(file_path).suffix.lower()
     if ext == ".pdf":
-        return PDFEngine(file_path)
+        return PDFEngine(file_path, disk_cache=disk_cache)
     elif ext == ".docx":
+        # Non-PDF engines pull in PIL; import them only when such a file is opened
+        from .docx_engine import DocxEngine
         return DocxEngine(file_path)
     elif ext == ".txt":
+        from .txt_engine import TextEngine
         return TextEngine(file_path)
     elif ext in (".pptx", ".ppt"):
         if ext == ".ppt":
             raise ValueError(
                 "旧版 .ppt 格式不被支持，请将文件另存为 .pptx 格式后再试。"
             )
+        from .pptx_engine import PptxEngine
         return PptxEngine(file_path)
     else:
         raise ValueError(f"Unsupported file type: {ext}")
@@ -15,6 +15,12 @@ class Engine:
     )
     PIPELINE_DEPENDENCY_ERROR_MARKER = "A dependency error occurred during pipeline creation"
     MODEL_NAME_MISMATCH_MARKER = "Model name mismatch"
+    # Works for both Windows and POSIX paths.
+    BROKEN_MODEL_FILE_RE = re.compile(r"Cannot open file\s+(.+?inference\.json)", re.IGNORECASE)
+    BROKEN_MODEL_NAME_RE = re.compile(
+        r"official_models[\\/]+([^\\/,\s]+)[\\/]+inference\.json",
+        re.IGNORECASE,
+    )
     FALLBACK_OCR_DEP_PACKAGES = (
         "Jinja2",
         "beautifulsoup4",
@@ -495,22 +501,13 @@ class Engine:
         allowed_roots = self._get_model_cache_roots()
         candidate_dirs: list[Path] = []
 
-        # Works for both Windows and POSIX paths.
-        match = re.search(
-            r"Cannot open file\s+(.+?inference\.json)",
-            error_message,
-            re.IGNORECASE,
-        )
+        match = self.BROKEN_MODEL_FILE_RE.search(error_message)
         if match:
             broken_file = match.group(1).strip().strip("'\"")
             candidate_dirs.append(Path(os.path.dirname(broken_file)))
 
         # Fallback: if path parsing fails, locate model directory by model name.
-        model_match = re.search(
-            r"official_models[\\/]+([^\\/,\s]+)[\\/]+inference\.json",
-            error_message,
-            re.IGNORECASE,
-        )
+        model_match = self.BROKEN_MODEL_NAME_RE.search(error_message)
         if model_match:
             model_name = model_match.group(1)
             for root in allowed_roots:
@@ -3,11 +3,13 @@ PDF Engine using PyMuPDF for rendering and text extraction.
 """
 
 import base64
+import threading
+from collections import OrderedDict, deque
 import fitz  # PyMuPDF
-from io import BytesIO
 from pathlib import Path
 from typing import Optional, Tuple
-from PIL import Image
+
+from .render_cache import SHARED_RENDER_CACHE, DiskRenderCache, file_content_id
 
 
 class PDFEngine:
@@ -21,18 +23,37 @@ class PDFEngine:
     - Get page dimensions and metadata
     """
 
-    def __init__(self, file_path: str):
+    # Clip rectangles smaller than this (in points) cannot enclose a glyph
+    MIN_CLIP_SIZE = 2.0
+    # Recent region extractions kept for repeated selections
+    CLIP_TEXT_CACHE_SIZE = 64
+
+    _render_cache = SHARED_RENDER_CACHE  # (content_id, page_num, zoom) -> base64_image
+
+    def __init__(self, file_path: str, disk_cache: Optional[DiskRenderCache] = None):
         """
         Initialize the PDF engine with a file path.
 
         Args:
             file_path: Path to the PDF file
+            disk_cache: Optional persistent tier behind the memory render cache
         """
         self.file_path = file_path
+        self.disk_cache = disk_cache
         self.doc = fitz.open(file_path)
         self.page_count = len(self.doc)
-        self._cache: dict[tuple[int, float], str] = {}  # (page_num, zoom) -> base64_image
+        self.content_id = file_content_id(file_path)
         self._page_sizes: dict[int, tuple[float, float]] = {}  # page_num -> (width, height)
+        self._clip_text: OrderedDict[tuple, str] = OrderedDict()  # (page_num, rect) -> text
+        # PyMuPDF documents are not thread-safe; prefetch renders share this lock
+        self._lock = threading.RLock()
+        # Prefetch state, guarded by _prefetch_cond
+        self._prefetch_cond = threading.Condition()
+        self._prefetch_queue: deque[tuple[int, float]] = deque()  # (page_num, zoom)
+        self._prefetch_thread: Optional[threading.Thread] = None
+        self._foreground_renders = 0
+        self._prefetch_busy = False
+        self._closed = False
 
     def get_metadata(self) -> dict:
         """Get PDF metadata."""
@@ -55,35 +76,119 @@ class PDFEngine:
         Returns:
             Base64-encoded PNG image string (without data URI prefix)
         """
-        cache_key = (page_num, round(zoom, 2))
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        # Validate page number
-        if page_num < 1 or page_num > self.page_count:
-            raise ValueError(f"Invalid page number: {page_num}")
-
-        # Get page (0-indexed in PyMuPDF)
-        page = self.doc[page_num - 1]
-
-        # Create transformation matrix for zoom
-        mat = fitz.Matrix(zoom, zoom)
-
-        # Render page to pixmap
-        pix = page.get_pixmap(matrix=mat)
-
-        # Convert to PIL Image
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+        # Hold off the prefetch worker so it does not take the lock between
+        # its pages while a caller is waiting for this one.
+        with self._prefetch_cond:
+            self._foreground_renders += 1
+        try:
+            return self._render(page_num, zoom)
+        finally:
+            with self._prefetch_cond:
+                self._foreground_renders -= 1
+                self._prefetch_cond.notify_all()
+
+    def _render(self, page_num: int, zoom: float) -> str:
+        with self._lock:
+            cache_key = (self.content_id, page_num, round(zoom, 2))
+            cached = self._render_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # Validate page number
+            if page_num < 1 or page_num > self.page_count:
+                raise ValueError(f"Invalid page number: {page_num}")
+
+            disk_cache = self.disk_cache
+            png = disk_cache.get(*cache_key) if disk_cache else None
+            if png is not None:
+                img_str = base64.b64encode(png).decode()
+                self._render_cache.put(cache_key, img_str)
+                return img_str
+
+            # Get page (0-indexed in PyMuPDF)
+            page = self.doc[page_num - 1]
+
+            # Create transformation matrix for zoom
+            mat = fitz.Matrix(zoom, zoom)
+
+            # Render page to pixmap
+            pix = page.get_pixmap(matrix=mat)
+
+            # Encode straight from the pixmap samples; no intermediate PIL copy
+            png = pix.tobytes("png")
+            img_str = base64.b64encode(png).decode()
+
+            # Cache the result
+            self._render_cache.put(cache_key, img_str)
+            if disk_cache:
+                disk_cache.put(*cache_key, png)
+
+            return img_str
+
+    def is_rendered(self, page_num: int, zoom: float = 1.0) -> bool:
+        """Check whether a page is already in the render cache."""
+        return (self.content_id, page_num, round(zoom, 2)) in self._render_cache
+
+    def prefetch_pages(self, page_nums: list[int], zoom: float = 1.0) -> bool:
+        """
+        Render pages into the cache on a background worker.
 
-        # Convert to base64
-        buffer = BytesIO()
-        img.save(buffer, format="PNG", optimize=True)
-        img_str = base64.b64encode(buffer.getvalue()).decode()
+        Pages that are out of range or already cached are skipped. A newer
+        prefetch request (or closing the document) replaces pages not yet started.
+        The worker renders one page at a time and yields to foreground renders.
 
-        # Cache the result
-        self._cache[cache_key] = img_str
+        Args:
+            page_nums: 1-based page numbers, in priority order
+            zoom: Zoom factor to render at
 
-        return img_str
+        Returns:
+            True if any pages were queued
+        """
+        pending = [
+            pn for pn in page_nums
+            if 1 <= pn <= self.page_count and not self.is_rendered(pn, zoom)
+        ]
+        with self._prefetch_cond:
+            if self._closed:
+                return False
+            self._prefetch_queue = deque((pn, zoom) for pn in pending)
+            if not pending:
+                return False
+            if self._prefetch_thread is None:
+                self._prefetch_thread = threading.Thread(
+                    target=self._run_prefetch, name="pdf-prefetch", daemon=True
+                )
+                self._prefetch_thread.start()
+            self._prefetch_cond.notify_all()
+        return True
+
+    def _run_prefetch(self):
+        while True:
+            with self._prefetch_cond:
+                while not self._closed and (
+                    not self._prefetch_queue or self._foreground_renders
+                ):
+                    self._prefetch_cond.wait()
+                if self._closed:
+                    return
+                page_num, zoom = self._prefetch_queue.popleft()
+                self._prefetch_busy = True
+            try:
+                # _render checks the cache under the lock before drawing
+                self._render(page_num, zoom)
+            except Exception:
+                pass
+            with self._prefetch_cond:
+                self._prefetch_busy = False
+                self._prefetch_cond.notify_all()
+
+    def wait_for_prefetch(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued prefetch pages are done; False on timeout."""
+        with self._prefetch_cond:
+            return self._prefetch_cond.wait_for(
+                lambda: self._closed or not (self._prefetch_queue or self._prefetch_busy),
+                timeout,
+            )
 
     def extract_text(self, page_num: int, rect: Optional[dict] = None) -> str:
         """
@@ -100,15 +205,31 @@ class PDFEngine:
         if page_num < 1 or page_num > self.page_count:
             raise ValueError(f"Invalid page number: {page_num}")
 
-        page = self.doc[page_num - 1]
-
-        if rect:
-            # Extract text from specific rectangle
-            fitz_rect = fitz.Rect(rect["x1"], rect["y1"], rect["x2"], rect["y2"])
-            return page.get_text("text", clip=fitz_rect)
-        else:
-            # Extract all text from page
-            return page.get_text("text")
+        with self._lock:
+            page = self.doc[page_num - 1]
+
+            if rect:
+                # Extract text from specific rectangle
+                fitz_rect = fitz.Rect(rect["x1"], rect["y1"], rect["x2"], rect["y2"])
+                if fitz_rect.width < self.MIN_CLIP_SIZE or fitz_rect.height < self.MIN_CLIP_SIZE:
+                    return ""
+
+                # Re-selecting (nearly) the same region skips the text-layer walk;
+                # a tenth of a point is far below glyph size.
+                clip_key = (page_num, tuple(round(v, 1) for v in fitz_rect))
+                text = self._clip_text.get(clip_key)
+                if text is not None:
+                    self._clip_text.move_to_end(clip_key)
+                    return text
+
+                text = page.get_text("text", clip=fitz_rect)
+                self._clip_text[clip_key] = text
+                if len(self._clip_text) > self.CLIP_TEXT_CACHE_SIZE:
+                    self._clip_text.popitem(last=False)
+                return text
+            else:
+                # Extract all text from page
+                return page.get_text("text")
 
     def get_page_size(self, page_num: int) -> Tuple[float, float]:
         """
@@ -126,8 +247,9 @@ class PDFEngine:
         if page_num < 1 or page_num > self.page_count:
             raise ValueError(f"Invalid page number: {page_num}")
 
-        page = self.doc[page_num - 1]
-        size = (page.rect.width, page.rect.height)
+        with self._lock:
+            page = self.doc[page_num - 1]
+            size = (page.rect.width, page.rect.height)
         self._page_sizes[page_num] = size
         return size
 
@@ -147,8 +269,8 @@ class PDFEngine:
         pages_to_search = [page_num] if page_num else range(1, self.page_count + 1)
 
         for pn in pages_to_search:
-            page = self.doc[pn - 1]
-            text_instances = page.search_for(query)
+            with self._lock:
+                text_instances = self.doc[pn - 1].search_for(query)
 
             for rect in text_instances:
                 results.append({
@@ -165,9 +287,14 @@ class PDFEngine:
 
     def close(self):
         """Close the PDF document and free resources."""
-        self._cache.clear()
-        self._page_sizes.clear()
-        self.doc.close()
+        with self._prefetch_cond:
+            self._closed = True
+            self._prefetch_queue.clear()
+            self._prefetch_cond.notify_all()
+        with self._lock:
+            self._page_sizes.clear()
+            self._clip_text.clear()
+            self.doc.close()
 
     def __enter__(self):
         return self
@@ -10,6 +10,8 @@ from typing import Dict, List, Optional, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
 
+from .render_cache import SHARED_RENDER_CACHE, file_content_id
+
 
 # Standard slide canvas dimensions in points (10" x 7.5" at 72 dpi)
 SLIDE_WIDTH = 720
@@ -33,7 +35,7 @@ class PptxEngine:
     def __init__(self, file_path: str):
         self.file_path = file_path
         self._font_cache: Dict[Tuple[int, bool], ImageFont.FreeTypeFont] = {}
-        self._render_cache: Dict[Tuple[int, float], str] = {}
+        self.content_id = file_content_id(file_path)
 
         try:
             import pptx
@@ -341,9 +343,10 @@ class PptxEngine:
         Returns:
             Base64-encoded PNG string (without data URI prefix)
         """
-        cache_key = (page_num, round(zoom, 2))
-        if cache_key in self._render_cache:
-            return self._render_cache[cache_key]
+        cache_key = (self.content_id, page_num, round(zoom, 2))
+        cached = SHARED_RENDER_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
 
         if page_num < 1 or page_num > self.page_count:
             raise ValueError(f"Invalid page number: {page_num}")
@@ -366,7 +369,7 @@ class PptxEngine:
         img.save(buffer, format="PNG", optimize=True)
         result = base64.b64encode(buffer.getvalue()).decode()
 
-        self._render_cache[cache_key] = result
+        SHARED_RENDER_CACHE.put(cache_key, result)
         return result
 
     def extract_text(self, page_num: int, rect: Optional[dict] = None) -> str:
@@ -424,7 +427,6 @@ class PptxEngine:
 
     def close(self):
         """Free resources."""
-        self._render_cache.clear()
         self._font_cache.clear()
 
     def __enter__(self):
@@ -0,0 +1,218 @@
+"""
+Bounded LRU caches for rendered page images (in memory and on disk).
+"""
+
+import hashlib
+import os
+import queue
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable, Optional
+
+
+class RenderCache:
+    """
+    Thread-safe least-recently-used cache of rendered pages.
+
+    Keys identify a page at a zoom level (e.g. ``(content_id, page_num, zoom)``)
+    and values are the base64-encoded PNG strings returned by the engines.
+    Once more than ``max_entries`` pages are stored, or their combined size
+    exceeds ``max_bytes``, the pages used longest ago are evicted. The most
+    recent page is always kept, even if it alone is over budget.
+    """
+
+    def __init__(self, max_entries: int = 32, max_bytes: int = 128 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Return the cached value for key and mark it most recently used."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: str):
+        """Store a value, evicting the least recently used entries if full."""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = value
+            self._bytes += len(value)
+
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """Combined length of all cached values."""
+        return self._bytes
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def file_content_id(file_path: str, chunk_size: int = 65536) -> str:
+    """
+    Fingerprint a document version for the render caches.
+
+    Hashes the file size and modification time plus its first and last
+    ``chunk_size`` bytes (for PDFs: the header, trailer, /ID and xref). The
+    mtime catches same-size edits that leave both ends untouched, so a
+    re-saved file never reuses renders persisted for the old version.
+    """
+    stat = os.stat(file_path)
+    size = stat.st_size
+    digest = hashlib.blake2b(f"{size}:{stat.st_mtime_ns}".encode(), digest_size=16)
+    with open(file_path, "rb") as f:
+        digest.update(f.read(chunk_size))
+        if size > chunk_size:
+            f.seek(max(chunk_size, size - chunk_size))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# Process-wide memory cache shared by every engine, keyed by
+# (content_id, page_num, zoom). Reopening an unchanged document reuses
+# pages that were already rendered.
+SHARED_RENDER_CACHE = RenderCache()
+
+
+def default_cache_dir(app_name: str = "BetterPDF") -> Path:
+    """
+    Platform location for disposable caches.
+
+    Kept apart from the persistent data directory so large throwaway files
+    never land in a roaming profile or a portable install's data folder.
+    """
+    home = Path.home()
+    if os.name == "nt":
+        base = Path(os.getenv("LOCALAPPDATA", str(home / "AppData" / "Local")))
+        return base / app_name / "cache"
+    if sys.platform == "darwin":
+        return home / "Library" / "Caches" / app_name
+    return Path(os.getenv("XDG_CACHE_HOME") or home / ".cache") / app_name
+
+
+class DiskRenderCache:
+    """
+    On-disk cache of rendered page PNGs, shared across sessions.
+
+    Files live at ``<root>/<content_id>/<page>_<zoom>.png``. Reads refresh a
+    file's mtime, and once the directory grows past ``max_bytes`` the files
+    with the oldest mtime are deleted. Writes, the initial size scan and
+    eviction all run on a background writer thread, so rendering never waits
+    on them. All I/O is best effort: any OS error is treated as a cache miss.
+    """
+
+    # Writes queued beyond this are dropped; the page stays in memory anyway
+    MAX_PENDING_WRITES = 64
+
+    def __init__(self, root: Path, max_bytes: int = 512 * 1024 * 1024):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._bytes = 0  # Only touched by the writer thread
+        self._writes: queue.Queue[tuple[Path, bytes]] = queue.Queue(self.MAX_PENDING_WRITES)
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
+    def _path(self, content_id: str, page_num: int, zoom: float) -> Path:
+        return self.root / content_id / f"{page_num}_{zoom:.2f}.png"
+
+    def get(self, content_id: str, page_num: int, zoom: float) -> Optional[bytes]:
+        """Return the cached PNG bytes for a page, or None."""
+        path = self._path(content_id, page_num, zoom)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, content_id: str, page_num: int, zoom: float, data: bytes):
+        """Queue PNG bytes for a page to be written in the background."""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run_writer, name="render-cache-writer", daemon=True
+                )
+                self._writer.start()
+        try:
+            self._writes.put_nowait((self._path(content_id, page_num, zoom), data))
+        except queue.Full:
+            pass
+
+    def flush(self):
+        """Block until every queued write has been handled."""
+        self._writes.join()
+
+    def _run_writer(self):
+        # Measure what earlier sessions left behind before the first write
+        self._bytes = sum(size for _, size, _ in self._scan())
+        while True:
+            path, data = self._writes.get()
+            try:
+                self._write(path, data)
+            finally:
+                self._writes.task_done()
+
+    def _write(self, path: Path, data: bytes):
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+        self._bytes += len(data) - replaced
+        if self._bytes > self.max_bytes:
+            self._evict()
+
+    def _scan(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.root.glob("*/*.png"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self):
+        # Trim to 90% of the budget so eviction does not rerun on every write
+        entries = sorted(self._scan())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._bytes = total
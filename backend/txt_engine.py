@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Optional, Tuple
 from PIL import Image, ImageDraw, ImageFont
 
+from .render_cache import SHARED_RENDER_CACHE, file_content_id
+
 
 class TextEngine:
     """
@@ -48,7 +50,8 @@ class TextEngine:
         self._pages = self._paginate_text()
         self.page_count = len(self._pages)
         self._font = self._get_font()
-        self._cache: dict[tuple[int, float], str] = {}  # (page_num, zoom) -> base64_image
+        self._scaled_fonts: dict[int, ImageFont.FreeTypeFont] = {}  # size -> font
+        self.content_id = file_content_id(file_path)
 
     def _load_file(self) -> str:
         """
@@ -123,23 +126,27 @@ class TextEngine:
         lines_per_page = int(usable_height / self.LINE_HEIGHT)
 
         # Wrap long lines
+        width = self.CHARS_PER_LINE
         wrapped_lines = []
+        append = wrapped_lines.append
         for line in self._content.split('\n'):
-            if not line:
-                wrapped_lines.append('')
+            if len(line) <= width and '\t' not in line and not line[-1:].isspace():
+                # Already fits on one line with nothing for textwrap to drop
+                append(line)
+                continue
+
+            # Wrap line to fit page width
+            wrapped = textwrap.wrap(
+                line,
+                width=width,
+                break_long_words=True,
+                break_on_hyphens=False,
+                replace_whitespace=False
+            )
+            if wrapped:
+                wrapped_lines.extend(wrapped)
             else:
-                # Wrap line to fit page width
-                wrapped = textwrap.wrap(
-                    line,
-                    width=self.CHARS_PER_LINE,
-                    break_long_words=True,
-                    break_on_hyphens=False,
-                    replace_whitespace=False
-                )
-                if wrapped:
-                    wrapped_lines.extend(wrapped)
-                else:
-                    wrapped_lines.append('')
+                append('')
 
         # Split into pages
         pages = []
@@ -163,6 +170,18 @@ class TextEngine:
             "subject": "Plain Text Document",
         }
 
+    def _get_scaled_font(self, size: int) -> ImageFont.FreeTypeFont:
+        """Get the base font at the given size, loading each size only once."""
+        if size in self._scaled_fonts:
+            return self._scaled_fonts[size]
+
+        try:
+            font = ImageFont.truetype(self._font.path, size)
+        except (OSError, IOError, AttributeError):
+            font = self._font
+        self._scaled_fonts[size] = font
+        return font
+
     def render_page(self, page_num: int, zoom: float = 1.0) -> str:
         """
         Render a page to a base64-encoded PNG image.
@@ -174,9 +193,10 @@ class TextEngine:
         Returns:
             Base64-encoded PNG image string (without data URI prefix)
         """
-        cache_key = (page_num, round(zoom, 2))
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cache_key = (self.content_id, page_num, round(zoom, 2))
+        cached = SHARED_RENDER_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Validate page number
         if page_num < 1 or page_num > self.page_count:
@@ -195,11 +215,7 @@ class TextEngine:
 
         # Scale font size with zoom
         if zoom != 1.0:
-            try:
-                scaled_font_size = int(self.FONT_SIZE * zoom)
-                font = ImageFont.truetype(self._font.path, scaled_font_size)
-            except (OSError, IOError, AttributeError):
-                font = self._font
+            font = self._get_scaled_font(int(self.FONT_SIZE * zoom))
         else:
             font = self._font
 
@@ -218,7 +234,7 @@ class TextEngine:
         img_str = base64.b64encode(buffer.getvalue()).decode()
 
         # Cache the result
-        self._cache[cache_key] = img_str
+        SHARED_RENDER_CACHE.put(cache_key, img_str)
 
         return img_str
 
@@ -267,14 +283,18 @@ class TextEngine:
         """
         results = []
         pages_to_search = [page_num] if page_num else range(1, self.page_count + 1)
+        query_lower = query.lower()
+        char_width = self.FONT_SIZE * 0.6  # Approximate char width
+        match_width = len(query) * char_width
 
         for pn in pages_to_search:
             page_lines = self._pages[pn - 1]
             page_text = '\n'.join(page_lines)
 
             # Find all occurrences
-            query_lower = query.lower()
             text_lower = page_text.lower()
+            if query_lower not in text_lower:
+                continue
             start = 0
 
             while True:
@@ -282,16 +302,16 @@ class TextEngine:
                 if pos == -1:
                     break
 
-                # Calculate line number and position
-                lines_before = page_text[:pos].count('\n')
+                # Calculate line number and position without slicing the page
+                lines_before = page_text.count('\n', 0, pos)
                 line_start_pos = page_text.rfind('\n', 0, pos) + 1
                 char_position = pos - line_start_pos
 
                 # Calculate approximate rectangle
                 y1 = self.MARGIN_TOP + (lines_before * self.LINE_HEIGHT)
                 y2 = y1 + self.LINE_HEIGHT
-                x1 = self.MARGIN_LEFT + (char_position * (self.FONT_SIZE * 0.6))  # Approximate char width
-                x2 = x1 + (len(query) * (self.FONT_SIZE * 0.6))
+                x1 = self.MARGIN_LEFT + (char_position * char_width)
+                x2 = x1 + match_width
 
                 results.append({
                     "page": pn,
@@ -309,7 +329,7 @@ class TextEngine:
 
     def close(self):
         """Close the document and free resources."""
-        self._cache.clear()
+        self._scaled_fonts.clear()
         self._pages.clear()
 
     def __enter__(self):
@@ -125,6 +125,10 @@ const API = {
                 percent: 100,
                 error: '',
             }),
+            batch: () => ({
+                success: true,
+                results: (args[0] || []).map(() => ({ success: true }))
+            }),
             get_app_info: () => ({
                 name: 'DeepRead AI',
                 version: '0.2.0 (Mock)'
@@ -380,6 +384,15 @@ const API = {
 
     // ==================== Utility ====================
 
+    /**
+     * Run several backend calls in a single bridge round-trip
+     * @param {Array<{method: string, args?: Array}>} calls - Calls to run in order
+     * @returns {Promise<{success: boolean, results?: Array}>}
+     */
+    async batch(calls) {
+        return this.call('batch', calls);
+    },
+
     /**
      * Get application information
      * @returns {Promise<{name: string, version: string}>}
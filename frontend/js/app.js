@@ -4,6 +4,27 @@
  * Coordinates the PDF viewer, AI chat panel, and page-linked notes.
  */
 
+// Toast icon markup by type; a pooled toast only re-parses it when its type changes
+const TOAST_ICONS = {
+    success: '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M20 6 9 17l-5-5"/></svg>',
+    error: '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M18 6 6 18"/><path d="m6 6 12 12"/></svg>',
+    warning: '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="m21.73 18-8-14a2 2 0 0 0-3.48 0l-8 14A2 2 0 0 0 4 21h16a2 2 0 0 0 1.73-3Z"/><path d="M12 9v4"/><path d="M12 17h.01"/></svg>',
+    info: '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="10"/><path d="M12 16v-4"/><path d="M12 8h.01"/></svg>'
+};
+
+const HTML_ESCAPES = {
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;'
+};
+
+// Escape all five HTML-significant characters in a single scan
+function escapeHtml(text) {
+    return String(text || '').replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+}
+
 class DeepReadApp {
     constructor() {
         this.currentPanel = 'ai'; // 'ai' or 'notes'
@@ -13,6 +34,9 @@ class DeepReadApp {
         this.settingsPanel = null;
         this.toastContainer = null;
         this.topToastContainer = null;
+        this.toastPool = [];
+        this.toastDeadlines = new Map(); // toast -> { generation, deadline }
+        this.toastTimer = null;
         this.isResizingPanels = false;
         this.leftPanelStorageKey = 'deepread_left_panel_width';
         this.pageNotes = new Map(); // page number -> note cards
@@ -51,7 +75,6 @@ class DeepReadApp {
         this.pdfViewer = new PDFViewer('pdf-panel-root');
         this.aiPanel = new AIChatPanel('panel-content');
         this.notesPanel = new NotesPanel('panel-content');
-        this.settingsPanel = new SettingsPanel('settings-popup');
         this.setupSettingsPopup();
         this.setupPageSync();
         this.setupStatePersistenceSync();
@@ -78,12 +101,13 @@ class DeepReadApp {
         this.toastContainer = document.createElement('div');
         this.toastContainer.className = 'toast-container';
         this.toastContainer.id = 'toast-container';
-        document.body.appendChild(this.toastContainer);
 
         this.topToastContainer = document.createElement('div');
         this.topToastContainer.className = 'toast-container toast-container-top';
         this.topToastContainer.id = 'toast-container-top';
-        document.body.appendChild(this.topToastContainer);
+
+        // Attach both fixed containers in a single body mutation
+        document.body.append(this.toastContainer, this.topToastContainer);
     }
 
     setupSidebar() {
@@ -160,6 +184,10 @@ class DeepReadApp {
         const btn = document.getElementById('settings-btn');
         if (!popup) return;
 
+        // Most sessions never open settings, so build the panel on first use
+        if (!this.settingsPanel) {
+            this.settingsPanel = new SettingsPanel('settings-popup');
+        }
         this.settingsPanel.render(popup);
         popup.hidden = false;
         this.settingsPopupOpen = true;
@@ -225,12 +253,19 @@ class DeepReadApp {
         const minLeft = 460;
         const minRight = 340;
 
+        // Last pixel width written to --left-panel-width (null while the
+        // default percentage is in effect), and the splitter geometry
+        // captured when a drag starts.
+        let leftWidthPx = null;
+        let dragGeometry = null;
+
         const applyLeftWidth = (leftWidth) => {
             const total = content.clientWidth;
             const splitterWidth = splitter.offsetWidth || 10;
             const maxLeft = Math.max(minLeft, total - minRight - splitterWidth);
             const clamped = Math.max(minLeft, Math.min(leftWidth, maxLeft));
             document.documentElement.style.setProperty('--left-panel-width', `${clamped}px`);
+            leftWidthPx = clamped;
             window.dispatchEvent(new Event('deepread:layout-resized'));
             return clamped;
         };
@@ -241,26 +276,28 @@ class DeepReadApp {
         }
 
         const onPointerMove = (e) => {
-            if (!this.isResizingPanels) return;
-            const rect = content.getBoundingClientRect();
-            const splitterWidth = splitter.offsetWidth || 10;
-            const nextLeft = e.clientX - rect.left - splitterWidth / 2;
-            applyLeftWidth(nextLeft);
+            if (!this.isResizingPanels || !dragGeometry) return;
+            applyLeftWidth(e.clientX - dragGeometry.offset);
         };
 
         const stopResize = () => {
             if (!this.isResizingPanels) return;
             this.isResizingPanels = false;
+            dragGeometry = null;
             document.body.classList.remove('is-resizing-panels');
-            const current = getComputedStyle(document.documentElement)
-                .getPropertyValue('--left-panel-width')
-                .trim();
-            localStorage.setItem(this.leftPanelStorageKey, current.replace('px', ''));
+            if (leftWidthPx !== null) {
+                localStorage.setItem(this.leftPanelStorageKey, String(leftWidthPx));
+            }
         };
 
         splitter.addEventListener('pointerdown', (e) => {
             e.preventDefault();
             this.isResizingPanels = true;
+            // The content box does not move during a drag, so measure once
+            // instead of forcing layout on every pointermove.
+            const rect = content.getBoundingClientRect();
+            const splitterWidth = splitter.offsetWidth || 10;
+            dragGeometry = { offset: rect.left + splitterWidth / 2 };
             document.body.classList.add('is-resizing-panels');
             splitter.setPointerCapture(e.pointerId);
         });
@@ -270,18 +307,14 @@ class DeepReadApp {
         splitter.addEventListener('pointercancel', stopResize);
         splitter.addEventListener('dblclick', () => {
             document.documentElement.style.setProperty('--left-panel-width', '60%');
+            leftWidthPx = null;
             localStorage.removeItem(this.leftPanelStorageKey);
             window.dispatchEvent(new Event('deepread:layout-resized'));
         });
 
         window.addEventListener('resize', () => {
-            const value = getComputedStyle(document.documentElement)
-                .getPropertyValue('--left-panel-width')
-                .trim();
-            if (!value.endsWith('px')) return;
-            const px = parseFloat(value);
-            if (!Number.isFinite(px)) return;
-            applyLeftWidth(px);
+            if (leftWidthPx === null) return;
+            applyLeftWidth(leftWidthPx);
         });
     }
 
@@ -397,6 +430,12 @@ class DeepReadApp {
     updateSidebarContext(panel = this.currentPanel) {
         document.querySelectorAll('.sidebar-panel-btn').forEach((btn) => {
             const visible = btn.dataset.panel === panel;
+            // switchPanel often re-selects the current panel (e.g. when a note
+            // is added); skip the attribute writes unless the state flips.
+            if (btn.classList.contains('is-context-visible') === visible
+                && btn.hasAttribute('aria-hidden')) {
+                return;
+            }
             btn.classList.toggle('is-context-visible', visible);
             btn.setAttribute('aria-hidden', visible ? 'false' : 'true');
             btn.tabIndex = visible ? 0 : -1;
@@ -470,7 +509,10 @@ class DeepReadApp {
             }
             if (result.success) {
                 this.recentFiles = Array.isArray(result.files) ? result.files : [];
-                this.renderRecentFilesMenu();
+                // A closed menu is rebuilt from this list when it next opens
+                if (this.recentMenuOpen) {
+                    this.renderRecentFilesMenu();
+                }
             } else {
                 console.error('Failed to load recent files:', result.error || 'Unknown error');
             }
@@ -626,13 +668,16 @@ class DeepReadApp {
     schedulePersistPageNotes() {
         if (!this.currentFilePath) return;
         const pathSnapshot = this.currentFilePath;
-        const notesSnapshot = this.serializePageNotes();
         if (this.notesSaveTimer) {
             clearTimeout(this.notesSaveTimer);
         }
+        // Serialize when the timer fires, not per call, so callers on the
+        // keystroke path stay cheap. Switching documents flushes and clears
+        // this timer first, so the path only changes if that was skipped.
         this.notesSaveTimer = setTimeout(() => {
             this.notesSaveTimer = null;
-            this.persistPageNotesForPath(pathSnapshot, notesSnapshot);
+            if (this.currentFilePath !== pathSnapshot) return;
+            this.persistPageNotesForPath(pathSnapshot, this.serializePageNotes());
         }, 450);
     }
 
@@ -704,9 +749,19 @@ class DeepReadApp {
             this.sessionStateSaveTimer = null;
         }
 
-        const notesSnapshot = this.serializePageNotes();
-        await this.persistPageNotesForPath(pathSnapshot, notesSnapshot, { silent: true });
-        await this.saveSessionState(pathSnapshot, this.pdfViewer?.getViewState());
+        // Save notes and view state in one bridge round-trip; this runs on
+        // the critical path of switching documents.
+        const calls = [
+            { method: 'save_page_notes', args: [pathSnapshot, this.serializePageNotes()] }
+        ];
+        if (this.pdfViewer) {
+            calls.push({ method: 'save_session_state', args: [pathSnapshot, this.pdfViewer.getViewState()] });
+        }
+        const result = await API.batch(calls);
+        const failed = result.success
+            ? result.results.filter(item => !item?.success)
+            : [result];
+        failed.forEach(item => console.error('Failed to persist document state:', item?.error));
     }
 
     async saveCurrentNote() {
@@ -794,6 +849,9 @@ class DeepReadApp {
 
     onPageChanged(page) {
         if (!Number.isFinite(page) || page < 1) return;
+        // Re-emits for the page the notes panel already tracks (e.g. on
+        // document load) would only rebuild the same notes list.
+        if (this.notesPanel && page === this.notesPanel.activePage) return;
         this.notesPanel?.setActivePage(page);
         this.pdfViewer?.clearNoteFocus();
     }
@@ -860,12 +918,7 @@ class DeepReadApp {
     }
 
     escapeHtml(text) {
-        return String(text || '')
-            .replace(/&/g, '&amp;')
-            .replace(/</g, '&lt;')
-            .replace(/>/g, '&gt;')
-            .replace(/"/g, '&quot;')
-            .replace(/'/g, '&#39;');
+        return escapeHtml(text);
     }
 
     // ==================== Toast Notifications ====================
@@ -877,44 +930,108 @@ class DeepReadApp {
             : this.toastContainer;
         if (!mountNode) return null;
 
-        const toast = document.createElement('div');
+        const toast = this.acquireToast();
+        const generation = toast.toastGeneration;
+        const [icon, text] = toast.children;
         toast.className = `toast ${type}`;
-
-        const icons = {
-            success: '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M20 6 9 17l-5-5"/></svg>',
-            error: '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M18 6 6 18"/><path d="m6 6 12 12"/></svg>',
-            warning: '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="m21.73 18-8-14a2 2 0 0 0-3.48 0l-8 14A2 2 0 0 0 4 21h16a2 2 0 0 0 1.73-3Z"/><path d="M12 9v4"/><path d="M12 17h.01"/></svg>',
-            info: '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="10"/><path d="M12 16v-4"/><path d="M12 8h.01"/></svg>'
-        };
-
-        toast.innerHTML = `
-            <span style="display:flex;align-items:center;color:var(--${type === 'success' ? 'success' : type === 'error' ? 'error' : type === 'warning' ? 'warning' : 'info'})">${icons[type] || icons.info}</span>
-            <span class="toast-message">${message}</span>
-            <button class="toast-close">
-                <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M18 6 6 18"/><path d="m6 6 12 12"/></svg>
-            </button>
-        `;
-
-        // Close button
-        toast.querySelector('.toast-close').addEventListener('click', () => {
-            toast.remove();
-        });
+        const iconType = type in TOAST_ICONS ? type : 'info';
+        if (icon.dataset.iconType !== iconType) {
+            icon.innerHTML = TOAST_ICONS[iconType];
+            icon.dataset.iconType = iconType;
+        }
+        text.innerHTML = message;
 
         mountNode.appendChild(toast);
 
         // Auto remove
         if (duration > 0) {
-            setTimeout(() => {
-                toast.style.opacity = '0';
-                toast.style.transform = 'translateX(100%)';
-                setTimeout(() => toast.remove(), 300);
-            }, duration);
+            this.toastDeadlines.set(toast, { generation, deadline: performance.now() + duration });
+            this.armToastTimer();
         }
 
         return toast;
     }
+
+    acquireToast() {
+        // Reuse a released toast element when one is pooled; the generation
+        // counter lets timers and animations from its previous use go stale.
+        let toast = this.toastPool.pop();
+        if (!toast) {
+            toast = document.createElement('div');
+            toast.innerHTML = `
+                <span class="toast-icon"></span>
+                <span class="toast-message"></span>
+                <button class="toast-close">
+                    <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M18 6 6 18"/><path d="m6 6 12 12"/></svg>
+                </button>
+            `;
+            toast.toastGeneration = 0;
+            toast.querySelector('.toast-close').addEventListener('click', () => {
+                this.releaseToast(toast, toast.toastGeneration);
+            });
+        }
+        toast.toastGeneration += 1;
+        return toast;
+    }
+
+    armToastTimer() {
+        // One timer serves every visible toast: it always targets the
+        // earliest pending deadline and is re-armed after each flush.
+        clearTimeout(this.toastTimer);
+        this.toastTimer = null;
+        if (!this.toastDeadlines.size) return;
+
+        let next = Infinity;
+        for (const { deadline } of this.toastDeadlines.values()) {
+            next = Math.min(next, deadline);
+        }
+        this.toastTimer = setTimeout(() => {
+            const now = performance.now();
+            for (const [toast, { generation, deadline }] of this.toastDeadlines) {
+                if (deadline <= now) {
+                    this.toastDeadlines.delete(toast);
+                    this.dismissToast(toast, generation);
+                }
+            }
+            this.armToastTimer();
+        }, Math.max(0, next - performance.now()));
+    }
+
+    releaseToast(toast, generation) {
+        if (toast.toastGeneration !== generation || !toast.isConnected) return;
+        this.toastDeadlines.delete(toast);
+        toast.remove();
+        toast.getAnimations().forEach(animation => animation.cancel());
+        if (this.toastPool.length < 8) {
+            this.toastPool.push(toast);
+        }
+    }
+
+    dismissToast(toast, generation) {
+        if (toast.toastGeneration !== generation || !toast.isConnected) return;
+        // Fade out on the compositor and release once the animation settles
+        const release = () => this.releaseToast(toast, generation);
+        toast.animate(
+            [
+                { opacity: 1, transform: 'translateX(0)' },
+                { opacity: 0, transform: 'translateX(100%)' }
+            ],
+            { duration: 300, easing: 'ease-in', fill: 'forwards' }
+        ).finished.then(release, release);
+    }
 }
 
+// Any character or line shape that marked.js could turn into markup;
+// replies without them skip the markdown parser entirely.
+const MARKDOWN_SYNTAX_RE = /[#*_`~[\]()<>&|\\=+-]|^\s*\d+[.)]|^ {4}|\t|https?:|www\./m;
+
+// Chat labels for the document-level quick actions
+const QUICK_ACTION_NAMES = {
+    full_summary: 'Full Summary',
+    key_points: 'Key Points',
+    questions: 'Questions'
+};
+
 /**
  * AI Chat Panel
  */
@@ -924,6 +1041,8 @@ class AIChatPanel {
         this.messages = [];
         this.isProcessing = false;
         this.pendingSelectionContext = null;
+        this.markdownOptions = null;
+        this.messageActionsTemplate = null;
     }
 
     render(container) {
@@ -995,6 +1114,16 @@ class AIChatPanel {
             this.clearPendingSelectionContext({ focusInput: true });
         });
 
+        // One delegated handler serves every message's "Save to Notes" button
+        document.getElementById('chat-messages')?.addEventListener('click', (e) => {
+            const saveBtn = e.target.closest('.btn-save-as-note');
+            if (!saveBtn) return;
+            const entry = this.messages[Number(saveBtn.dataset.messageIndex)];
+            if (entry) {
+                window.app?.createNoteFromAiResponse(entry.text);
+            }
+        });
+
         // Input textarea
         const input = document.getElementById('chat-input');
         input?.addEventListener('keydown', (e) => {
@@ -1050,13 +1179,7 @@ class AIChatPanel {
     }
 
     async handleQuickAction(action) {
-        const actionNames = {
-            full_summary: 'Full Summary',
-            key_points: 'Key Points',
-            questions: 'Questions'
-        };
-
-        this.addUserMessage(`[${actionNames[action]}]`);
+        this.addUserMessage(`[${QUICK_ACTION_NAMES[action]}]`);
 
         // Extract text from the current page to provide document context
         let context = '';
@@ -1181,16 +1304,9 @@ class AIChatPanel {
             // Render markdown-like formatting
             message.innerHTML = this.formatMessage(text);
 
-            // Append "Save to Notes" action button
-            const actions = document.createElement('div');
-            actions.className = 'ai-message-actions';
-            const saveBtn = document.createElement('button');
-            saveBtn.className = 'btn-save-as-note';
-            saveBtn.textContent = '\u2295 Save to Notes';
-            saveBtn.addEventListener('click', () => {
-                window.app?.createNoteFromAiResponse(text);
-            });
-            actions.appendChild(saveBtn);
+            // Append "Save to Notes" action button, stamped from a shared template
+            const actions = this.getMessageActionsTemplate().cloneNode(true);
+            actions.firstChild.dataset.messageIndex = String(this.messages.length);
             message.appendChild(actions);
         } else {
             message.textContent = text;
@@ -1202,13 +1318,43 @@ class AIChatPanel {
         this.messages.push({ role, text });
     }
 
-    formatMessage(text) {
-        // Full markdown rendering via marked.js
-        if (typeof marked !== 'undefined') {
+    getMessageActionsTemplate() {
+        if (!this.messageActionsTemplate) {
+            const actions = document.createElement('div');
+            actions.className = 'ai-message-actions';
+            const saveBtn = document.createElement('button');
+            saveBtn.className = 'btn-save-as-note';
+            saveBtn.textContent = '\u2295 Save to Notes';
+            actions.appendChild(saveBtn);
+            this.messageActionsTemplate = actions;
+        }
+        return this.messageActionsTemplate;
+    }
+
+    getMarkdownOptions() {
+        // Renderer overrides never change, so build them once per panel
+        // instead of once per message.
+        if (!this.markdownOptions) {
             const renderer = new marked.Renderer();
             renderer.link = ({ href, text }) =>
                 `<a href="${href}" target="_blank" rel="noopener">${text}</a>`;
-            return marked.parse(text, { renderer, breaks: true });
+            this.markdownOptions = { renderer, breaks: true };
+        }
+        return this.markdownOptions;
+    }
+
+    formatMessage(text) {
+        // Plain-text fast path: paragraphs and line breaks only
+        if (!MARKDOWN_SYNTAX_RE.test(text)) {
+            return text
+                .trim()
+                .split(/\n\s*\n/)
+                .map(paragraph => `<p>${paragraph.replace(/\n/g, '<br>')}</p>`)
+                .join('\n');
+        }
+        // Full markdown rendering via marked.js
+        if (typeof marked !== 'undefined') {
+            return marked.parse(text, this.getMarkdownOptions());
         }
         // Fallback: basic formatting if marked.js not loaded
         return text
@@ -1680,6 +1826,8 @@ class NotesPanel {
         this.activePage = 1;
         this.activeNoteId = '';
         this.editingNoteId = null;
+        this.saveStatusTimer = null;
+        this.renderedListHtml = '';
     }
 
     render(container) {
@@ -1695,7 +1843,7 @@ class NotesPanel {
         const noteCount = notes.length;
         const countLabel = `${noteCount} ${noteCount === 1 ? 'note' : 'notes'}`;
 
-        container.innerHTML = `
+        const html = `
             <div class="notes-container">
                 <div class="page-notes-header">
                     <div class="page-notes-title-wrap">
@@ -1710,6 +1858,15 @@ class NotesPanel {
             </div>
         `;
 
+        // Switching back to an unchanged list keeps the mounted DOM and its
+        // listeners instead of reparsing every card.
+        if (html === this.renderedListHtml && container.querySelector('.notes-container')) {
+            this.updateActiveCardStyles();
+            return;
+        }
+        container.innerHTML = html;
+        this.renderedListHtml = html;
+
         this.bindEvents();
     }
 
@@ -1817,21 +1974,30 @@ class NotesPanel {
 
         const textarea = container.querySelector('.note-editor-textarea');
         if (textarea) {
+            const timeEl = container.querySelector('#note-editor-time');
+            const statusEl = container.querySelector('#note-editor-save-status');
             textarea.addEventListener('input', (event) => {
+                // Keep the note model current on every keystroke; persistence is
+                // debounced by schedulePersistPageNotes and the status label by
+                // saveStatusTimer.
                 const updatedAt = this.handleNoteInput(noteId, event.target.value);
-                const timeEl = container.querySelector('#note-editor-time');
-                if (timeEl && updatedAt) {
-                    timeEl.textContent = `Updated ${this.formatTime(updatedAt)}`;
-                }
-                const statusEl = container.querySelector('#note-editor-save-status');
-                if (statusEl) {
+                if (!updatedAt) return;
+                if (statusEl && statusEl.textContent !== 'Saving...') {
                     statusEl.textContent = 'Saving...';
-                    clearTimeout(this._saveStatusTimer);
-                    this._saveStatusTimer = setTimeout(() => {
-                        statusEl.textContent = 'Saved';
-                        setTimeout(() => { statusEl.textContent = ''; }, 1500);
-                    }, 600);
                 }
+
+                window.app?.schedulePersistPageNotes();
+                if (timeEl) {
+                    timeEl.textContent = `Updated ${this.formatTime(updatedAt)}`;
+                }
+
+                clearTimeout(this.saveStatusTimer);
+                this.saveStatusTimer = setTimeout(() => {
+                    if (statusEl) statusEl.textContent = 'Saved';
+                    this.saveStatusTimer = setTimeout(() => {
+                        if (statusEl) statusEl.textContent = '';
+                    }, 1500);
+                }, 600);
             });
         }
     }
@@ -1946,7 +2112,6 @@ class NotesPanel {
         const updatedAt = new Date().toISOString();
         note.note = text;
         note.updatedAt = updatedAt;
-        window.app?.schedulePersistPageNotes();
         return updatedAt;
     }
 
@@ -2023,10 +2188,8 @@ class NotesPanel {
         menu.appendChild(customItem);
 
         const rect = anchor.getBoundingClientRect();
-        menu.style.position = 'fixed';
         menu.style.top = `${rect.bottom + 4}px`;
         menu.style.left = `${rect.left}px`;
-        menu.style.zIndex = '9999';
         document.body.appendChild(menu);
 
         const closeOnOutside = (e) => {
@@ -2046,10 +2209,8 @@ class NotesPanel {
         const rect = anchor.getBoundingClientRect();
         const popup = document.createElement('div');
         popup.className = 'ai-custom-input';
-        popup.style.position = 'fixed';
         popup.style.top = `${rect.bottom + 4}px`;
         popup.style.left = `${rect.left}px`;
-        popup.style.zIndex = '9999';
 
         const textarea = document.createElement('textarea');
         textarea.className = 'ai-custom-input-field';
@@ -2163,12 +2324,7 @@ class NotesPanel {
     }
 
     escapeHtml(text) {
-        return String(text || '')
-            .replace(/&/g, '&amp;')
-            .replace(/</g, '&lt;')
-            .replace(/>/g, '&gt;')
-            .replace(/"/g, '&quot;')
-            .replace(/'/g, '&#39;');
+        return escapeHtml(text);
     }
 }
 
@@ -4,6 +4,108 @@
  * Handles PDF rendering, navigation, zoom, and text selection.
  */
 
+const OCR_STATUS_LABELS = {
+    processing: 'OCR: Processing...',
+    processed: 'OCR: Processed',
+    idle: 'OCR: Not Processed'
+};
+
+// Entries of the menu shown after a text selection
+const SELECTION_ACTIONS = [
+    { label: 'Explain', action: 'explain' },
+    { label: 'Summarize', action: 'summarize' },
+    { label: 'Translate', action: 'translate' },
+    { label: 'Define', action: 'define' },
+    { label: 'Ask AI', action: 'ask' },
+    { label: 'Take a Note', action: 'take_note' }
+];
+
+// Viewer chrome shared by every opened document, parsed once at load
+const VIEWER_TEMPLATE = document.createElement('template');
+VIEWER_TEMPLATE.innerHTML = `
+    <div class="pdf-toolbar">
+        <button id="prev-page" title="Previous Page (←)">
+            <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round">
+                <path d="m15 18-6-6 6-6"/>
+            </svg>
+        </button>
+        <button id="next-page" title="Next Page (→)">
+            <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round">
+                <path d="m9 18 6-6-6-6"/>
+            </svg>
+        </button>
+        <div class="page-info">
+            <span>Page</span>
+            <input type="text" id="page-input" value="1">
+            <span id="page-count">/ 0</span>
+        </div>
+        <div class="zoom-controls">
+            <button id="zoom-out" title="Zoom Out">
+                <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round">
+                    <circle cx="11" cy="11" r="8"/>
+                    <line x1="21" y1="21" x2="16.65" y2="16.65"/>
+                    <line x1="8" y1="11" x2="14" y2="11"/>
+                </svg>
+            </button>
+            <span class="zoom-level" id="zoom-level">100%</span>
+            <button id="zoom-in" title="Zoom In">
+                <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round">
+                    <circle cx="11" cy="11" r="8"/>
+                    <line x1="21" y1="21" x2="16.65" y2="16.65"/>
+                    <line x1="11" y1="8" x2="11" y2="14"/>
+                    <line x1="8" y1="11" x2="14" y2="11"/>
+                </svg>
+            </button>
+            <button id="fit-width" title="Fit Width">
+                <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round">
+                    <path d="M2 12h20"/>
+                    <path d="M20 12v6a2 2 0 0 1-2 2H6a2 2 0 0 1-2-2v-6"/>
+                    <path d="m4 8 4-4 4 4"/>
+                    <path d="M20 8l-4-4-4 4"/>
+                </svg>
+            </button>
+        </div>
+        <div class="ocr-entry" id="ocr-entry">
+            <button class="ocr-toggle-btn" id="ocr-toggle" title="OCR Text Recognition">
+                <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round">
+                    <rect x="3" y="3" width="18" height="18" rx="2"/>
+                    <path d="M7 7h2v2H7zM7 11h2v2H7zM7 15h2v2H7zM11 7h6M11 11h6M11 15h6"/>
+                </svg>
+                <span>OCR Text</span>
+                <svg class="ocr-caret" width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+                    <path d="m6 9 6 6 6-6"/>
+                </svg>
+            </button>
+            <div class="ocr-mode-menu" id="ocr-mode-menu" hidden>
+                <button class="ocr-mode-item" id="ocr-mode-page">
+                    <span class="ocr-mode-title">OCR This Page</span>
+                    <span class="ocr-mode-desc">Fast recognition for current page only.</span>
+                </button>
+                <button class="ocr-mode-item" id="ocr-mode-document">
+                    <span class="ocr-mode-title">OCR Entire Document</span>
+                    <span class="ocr-mode-desc">Background scan for all pages with progress.</span>
+                </button>
+            </div>
+        </div>
+        <div class="ocr-page-status idle" id="ocr-page-status" data-state="idle">OCR: Not Processed</div>
+        <div class="ocr-progress" id="ocr-progress" hidden>
+            <div class="ocr-progress-row">
+                <span class="ocr-progress-label" id="ocr-progress-label">OCR</span>
+                <span class="ocr-progress-meta" id="ocr-progress-meta">0%</span>
+            </div>
+            <div class="ocr-progress-track">
+                <div class="ocr-progress-fill" id="ocr-progress-fill"></div>
+            </div>
+        </div>
+    </div>
+    <div class="pdf-viewport" id="pdf-viewport">
+        <div class="pdf-page-container" id="page-container">
+            <img id="page-image" alt="PDF Page">
+            <div class="selection-layer" id="selection-layer"></div>
+        </div>
+    </div>
+`;
+
 class PDFViewer {
     constructor(containerId) {
         this.container = document.getElementById(containerId);
@@ -14,12 +116,17 @@ class PDFViewer {
         this.maxZoom = 4.0;
         this.zoomStep = 0.25;
 
-        this.pageImage = null;
-        this.pageContainer = null;
         this.isLoading = false;
+        this.renderPending = false;
+        this.renderedZoom = null;
+        this.zoomRenderTimer = null;
+        // Bumped per loadDocument so renders of a previous document are dropped
+        this.documentGeneration = 0;
 
         // Selection state
         this.isSelecting = false;
+        this.selectionFrame = null;
+        this.selectionOrigin = null;
         this.selectionStart = null;
         this.selectionEnd = null;
         this.selectionRect = null;
@@ -29,7 +136,6 @@ class PDFViewer {
 
         // Search state
         this.searchHighlights = {}; // page_num -> [{x1,y1,x2,y2}]
-        this.searchCurrentPage = 0; // first result page
 
         // OCR state
         this.ocrEnabled = false;
@@ -101,6 +207,7 @@ class PDFViewer {
     }
 
     async loadDocument(filePath) {
+        this.documentGeneration += 1;
         const result = await API.openPdf(filePath);
 
         if (result.success) {
@@ -121,20 +228,31 @@ class PDFViewer {
             this.ocrCachedPages = new Set(result.ocr_cached_pages || []);
             this.ocrEnabled = false;
             this.searchHighlights = {};
-            this.searchCurrentPage = 0;
             this.ocrMode = session.ocr_mode === 'document' ? 'document' : 'page';
             this.ocrPageLoadingPage = null;
             this.ocrDocumentFullyProcessed = false;
             this.autoFit = !hasSavedZoom;
+            this.renderedZoom = null;
             this.clearNoteFocus();
 
+            this.pageDimensions = result.page_width && result.page_height
+                ? { width: result.page_width, height: result.page_height }
+                : null;
+
             this.renderViewer();
-            await this.renderPage();
-            if (this.autoFit) {
+            // Fit before the first render so the page is rasterized only once
+            const fitZoom = this.autoFit ? this.getFitZoom() : null;
+            if (fitZoom !== null) {
+                this.zoom = Math.round(fitZoom * 1000) / 1000;
+            }
+            // Let the caller hydrate notes and panels while the first page
+            // renders; only the fit-width fallback needs the rendered size.
+            const firstRender = this.renderPage();
+            if (this.autoFit && fitZoom === null) {
+                await firstRender;
                 this.fitWidth();
-            } else {
-                this.updateZoomDisplay();
             }
+            this.updateZoomDisplay();
             this.updatePageInfo();
             this.updateOcrPageStatus();
             this.emitPageChanged();
@@ -150,91 +268,12 @@ class PDFViewer {
     }
 
     renderViewer() {
-        this.container.innerHTML = `
-            <div class="pdf-toolbar">
-                <button id="prev-page" title="Previous Page (←)">
-                    <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round">
-                        <path d="m15 18-6-6 6-6"/>
-                    </svg>
-                </button>
-                <button id="next-page" title="Next Page (→)">
-                    <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round">
-                        <path d="m9 18 6-6-6-6"/>
-                    </svg>
-                </button>
-                <div class="page-info">
-                    <span>Page</span>
-                    <input type="text" id="page-input" value="1">
-                    <span id="page-count">/ ${this.pageCount}</span>
-                </div>
-                <div class="zoom-controls">
-                    <button id="zoom-out" title="Zoom Out">
-                        <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round">
-                            <circle cx="11" cy="11" r="8"/>
-                            <line x1="21" y1="21" x2="16.65" y2="16.65"/>
-                            <line x1="8" y1="11" x2="14" y2="11"/>
-                        </svg>
-                    </button>
-                    <span class="zoom-level" id="zoom-level">100%</span>
-                    <button id="zoom-in" title="Zoom In">
-                        <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round">
-                            <circle cx="11" cy="11" r="8"/>
-                            <line x1="21" y1="21" x2="16.65" y2="16.65"/>
-                            <line x1="11" y1="8" x2="11" y2="14"/>
-                            <line x1="8" y1="11" x2="14" y2="11"/>
-                        </svg>
-                    </button>
-                    <button id="fit-width" title="Fit Width">
-                        <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round">
-                            <path d="M2 12h20"/>
-                            <path d="M20 12v6a2 2 0 0 1-2 2H6a2 2 0 0 1-2-2v-6"/>
-                            <path d="m4 8 4-4 4 4"/>
-                            <path d="M20 8l-4-4-4 4"/>
-                        </svg>
-                    </button>
-                </div>
-                <div class="ocr-entry" id="ocr-entry">
-                    <button class="ocr-toggle-btn" id="ocr-toggle" title="OCR Text Recognition">
-                        <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round">
-                            <rect x="3" y="3" width="18" height="18" rx="2"/>
-                            <path d="M7 7h2v2H7zM7 11h2v2H7zM7 15h2v2H7zM11 7h6M11 11h6M11 15h6"/>
-                        </svg>
-                        <span>OCR Text</span>
-                        <svg class="ocr-caret" width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                            <path d="m6 9 6 6 6-6"/>
-                        </svg>
-                    </button>
-                    <div class="ocr-mode-menu" id="ocr-mode-menu" hidden>
-                        <button class="ocr-mode-item" id="ocr-mode-page">
-                            <span class="ocr-mode-title">OCR This Page</span>
-                            <span class="ocr-mode-desc">Fast recognition for current page only.</span>
-                        </button>
-                        <button class="ocr-mode-item" id="ocr-mode-document">
-                            <span class="ocr-mode-title">OCR Entire Document</span>
-                            <span class="ocr-mode-desc">Background scan for all pages with progress.</span>
-                        </button>
-                    </div>
-                </div>
-                <div class="ocr-page-status idle" id="ocr-page-status">OCR: Not Processed</div>
-                <div class="ocr-progress" id="ocr-progress" hidden>
-                    <div class="ocr-progress-row">
-                        <span class="ocr-progress-label" id="ocr-progress-label">OCR</span>
-                        <span class="ocr-progress-meta" id="ocr-progress-meta">0%</span>
-                    </div>
-                    <div class="ocr-progress-track">
-                        <div class="ocr-progress-fill" id="ocr-progress-fill"></div>
-                    </div>
-                </div>
-            </div>
-            <div class="pdf-viewport" id="pdf-viewport">
-                <div class="pdf-page-container" id="page-container">
-                    <img id="page-image" alt="PDF Page">
-                    <div class="selection-layer" id="selection-layer"></div>
-                </div>
-            </div>
-        `;
+        // Clone the pre-parsed toolbar/viewport shell instead of re-parsing
+        // its markup on every document open.
+        this.container.replaceChildren(VIEWER_TEMPLATE.content.cloneNode(true));
 
         this.bindEvents();
+        this.updatePageInfo();
         this.updateOcrPageStatus();
     }
 
@@ -349,18 +388,44 @@ class PDFViewer {
     }
 
     async renderPage() {
-        if (this.isLoading || !this.pageCount) return;
+        if (!this.pageCount) return;
+        if (this.isLoading) {
+            // Coalesce: render once more with the latest page/zoom when done
+            this.renderPending = true;
+            return;
+        }
 
         this.isLoading = true;
-        const img = document.getElementById('page-image');
+        const zoom = this.zoom;
+        const generation = this.documentGeneration;
+        let rendered = false;
 
         try {
-            const result = await API.getPage(this.currentPage, this.zoom);
-
-            if (result.success) {
+            const result = await API.getPage(this.currentPage, zoom);
+
+            // The first render is not awaited by loadDocument, so a render of
+            // the previous document can still be in flight here
+            if (result.success && generation === this.documentGeneration) {
+                // Decode the new page off the main thread and swap it in only
+                // once it is ready, instead of decoding synchronously at paint.
+                const img = new Image();
+                img.id = 'page-image';
+                img.alt = 'PDF Page';
                 img.src = `data:image/png;base64,${result.image_data}`;
-                img.style.width = `${result.page_width * this.zoom}px`;
-                img.style.height = `${result.page_height * this.zoom}px`;
+                try {
+                    await img.decode();
+                } catch (error) {
+                    // Swap anyway; the browser will decode it on paint
+                }
+                if (generation !== this.documentGeneration) return;
+                img.style.width = `${result.page_width * zoom}px`;
+                img.style.height = `${result.page_height * zoom}px`;
+                document.getElementById('page-image')?.replaceWith(img);
+                this.renderedZoom = zoom;
+                rendered = true;
+                // Drops the preview transform, or keeps scaling if the zoom
+                // moved again while this render was in flight.
+                this.previewZoom();
 
                 // Store page dimensions for coordinate calculations
                 this.pageDimensions = {
@@ -368,24 +433,37 @@ class PDFViewer {
                     height: result.page_height
                 };
 
+                // The image was just sized to exactly this zoom, so every
+                // overlay can share it instead of each forcing a layout read.
+                const scale = { x: zoom, y: zoom };
+
                 // Re-render OCR overlay if enabled (handles zoom changes)
                 if (this.ocrEnabled && this.ocrResults[this.currentPage]) {
-                    this.renderOcrOverlay(this.ocrResults[this.currentPage]);
+                    this.renderOcrOverlay(this.ocrResults[this.currentPage], scale);
                 } else {
                     this.clearOcrOverlay();
                 }
 
                 if (this.focusedNote?.page === this.currentPage && this.focusedNote.rectPdf) {
-                    this.renderNoteFocusHighlight(this.focusedNote.rectPdf);
+                    this.renderNoteFocusHighlight(this.focusedNote.rectPdf, scale);
                 }
 
-                this.renderSearchHighlights();
+                this.renderSearchHighlights(scale);
             }
         } catch (error) {
             console.error('Failed to render page:', error);
         } finally {
             this.isLoading = false;
+            // A failed render must not leave the page scaled by the preview
+            // (which also blocks selection); a queued render may still land.
+            if (!rendered && !this.renderPending) {
+                this.clearZoomPreview();
+            }
             this.updateOcrPageStatus();
+            if (this.renderPending) {
+                this.renderPending = false;
+                this.renderPage();
+            }
         }
     }
 
@@ -429,8 +507,12 @@ class PDFViewer {
         const prevBtn = document.getElementById('prev-page');
         const nextBtn = document.getElementById('next-page');
 
-        if (pageInput) pageInput.value = this.currentPage;
-        if (pageCount) pageCount.textContent = `/ ${this.pageCount}`;
+        // Write only what changed: reassigning the input value resets its
+        // caret, and replacing text nodes invalidates layout for nothing.
+        const pageValue = String(this.currentPage);
+        const countLabel = `/ ${this.pageCount}`;
+        if (pageInput && pageInput.value !== pageValue) pageInput.value = pageValue;
+        if (pageCount && pageCount.textContent !== countLabel) pageCount.textContent = countLabel;
 
         if (prevBtn) prevBtn.disabled = this.currentPage <= 1;
         if (nextBtn) nextBtn.disabled = this.currentPage >= this.pageCount;
@@ -450,23 +532,71 @@ class PDFViewer {
 
     setZoom(zoom, options = {}) {
         const { manual = true } = options;
-        this.zoom = Math.max(this.minZoom, Math.min(this.maxZoom, zoom));
+        // Quantize so float drift (or a resize that lands on the same fit
+        // width) does not trigger a render that would look identical.
+        const clamped = Math.max(this.minZoom, Math.min(this.maxZoom, zoom));
+        const nextZoom = Math.round(clamped * 1000) / 1000;
         if (manual) {
             this.autoFit = false;
         }
-        this.renderPage();
+        if (nextZoom === this.zoom) return;
+
+        this.zoom = nextZoom;
+        this.previewZoom();
+        this.scheduleZoomRender();
         this.updateZoomDisplay();
         this.emitViewStateChanged('zoom');
     }
 
-    fitWidth() {
+    previewZoom() {
+        // Scale the rendered page (and its overlays) on the compositor right
+        // away, without a layout pass; the sharp render replaces it.
+        const container = document.getElementById('page-container');
+        if (!container || !this.renderedZoom) return;
+
+        const ratio = this.zoom / this.renderedZoom;
+        container.style.transform = ratio === 1 ? '' : `scale(${ratio})`;
+
+        // A drag measured against the old layout would map to the wrong PDF
+        // coordinates once the page is scaled, so drop it.
+        if (ratio !== 1 && this.isSelecting) {
+            this.isSelecting = false;
+            this.clearSelection();
+        }
+    }
+
+    clearZoomPreview() {
+        const container = document.getElementById('page-container');
+        if (container) container.style.transform = '';
+    }
+
+    isZoomPreviewActive() {
+        return !!document.getElementById('page-container')?.style.transform;
+    }
+
+    scheduleZoomRender() {
+        clearTimeout(this.zoomRenderTimer);
+        this.zoomRenderTimer = setTimeout(() => {
+            this.zoomRenderTimer = null;
+            this.renderPage();
+        }, 30);
+    }
+
+    getFitZoom() {
         const viewport = document.getElementById('pdf-viewport');
-        if (viewport && this.pageDimensions) {
-            const padding = 16;
-            const availableWidth = Math.max(120, viewport.clientWidth - padding);
-            const newZoom = availableWidth / this.pageDimensions.width;
+        if (!viewport || !this.pageDimensions) return null;
+
+        const padding = 16;
+        const availableWidth = Math.max(120, viewport.clientWidth - padding);
+        const fitZoom = availableWidth / this.pageDimensions.width;
+        return Math.max(this.minZoom, Math.min(this.maxZoom, fitZoom));
+    }
+
+    fitWidth() {
+        const newZoom = this.getFitZoom();
+        if (newZoom !== null) {
             this.autoFit = true;
-            this.setZoom(Math.min(newZoom, this.maxZoom), { manual: false });
+            this.setZoom(newZoom, { manual: false });
         }
     }
 
@@ -493,12 +623,24 @@ class PDFViewer {
     onSelectionStart(e) {
         // Only left click
         if (e.button !== 0) return;
+        // Selection layer coordinates are unscaled; wait for the sharp render
+        if (this.isZoomPreviewActive()) return;
 
+        // The page only moves relative to the window when #pdf-viewport
+        // scrolls, so measure it once here and correct for the scroll offset
+        // on each move instead of forcing a layout read per mousemove.
         const pageContainer = document.getElementById('page-container');
+        const viewport = document.getElementById('pdf-viewport');
         const rect = pageContainer.getBoundingClientRect();
 
         this.clearSelection();
         this.isSelecting = true;
+        this.selectionOrigin = {
+            left: rect.left,
+            top: rect.top,
+            scrollLeft: viewport?.scrollLeft || 0,
+            scrollTop: viewport?.scrollTop || 0
+        };
         this.selectionStart = {
             x: e.clientX - rect.left,
             y: e.clientY - rect.top
@@ -509,21 +651,34 @@ class PDFViewer {
     onSelectionMove(e) {
         if (!this.isSelecting) return;
 
-        const pageContainer = document.getElementById('page-container');
-        const rect = pageContainer.getBoundingClientRect();
-
+        const origin = this.selectionOrigin;
+        const viewport = document.getElementById('pdf-viewport');
+        const scrollX = (viewport?.scrollLeft || 0) - origin.scrollLeft;
+        const scrollY = (viewport?.scrollTop || 0) - origin.scrollTop;
         this.selectionEnd = {
-            x: e.clientX - rect.left,
-            y: e.clientY - rect.top
+            x: e.clientX - origin.left + scrollX,
+            y: e.clientY - origin.top + scrollY
         };
 
-        this.updateSelectionOverlay();
+        // Pointer events can arrive far faster than the display refreshes;
+        // draw the latest rectangle at most once per frame.
+        if (this.selectionFrame === null) {
+            this.selectionFrame = requestAnimationFrame(() => {
+                this.selectionFrame = null;
+                if (this.isSelecting) this.updateSelectionOverlay();
+            });
+        }
     }
 
     async onSelectionEnd(e) {
         if (!this.isSelecting) return;
 
         this.isSelecting = false;
+        if (this.selectionFrame !== null) {
+            cancelAnimationFrame(this.selectionFrame);
+            this.selectionFrame = null;
+            this.updateSelectionOverlay();
+        }
 
         // Calculate selection rectangle
         const rect = this.calculateSelectionRect();
@@ -566,19 +721,21 @@ class PDFViewer {
         const rect = this.calculateSelectionRect();
         if (!rect) return;
 
-        // Remove existing highlight
-        const existing = layer.querySelector('.selection-highlight');
-        if (existing) existing.remove();
-
-        // Create new highlight
-        const highlight = document.createElement('div');
-        highlight.className = 'selection-highlight';
-        highlight.style.left = `${rect.x1}px`;
-        highlight.style.top = `${rect.y1}px`;
-        highlight.style.width = `${rect.x2 - rect.x1}px`;
-        highlight.style.height = `${rect.y2 - rect.y1}px`;
+        // Reuse the highlight for the whole drag instead of recreating it
+        // on every move, and snap it to whole pixels so the border stays crisp
+        let highlight = layer.querySelector('.selection-highlight');
+        if (!highlight) {
+            highlight = document.createElement('div');
+            highlight.className = 'selection-highlight';
+            layer.appendChild(highlight);
+        }
 
-        layer.appendChild(highlight);
+        const left = Math.round(rect.x1);
+        const top = Math.round(rect.y1);
+        highlight.style.left = `${left}px`;
+        highlight.style.top = `${top}px`;
+        highlight.style.width = `${Math.round(rect.x2) - left}px`;
+        highlight.style.height = `${Math.round(rect.y2) - top}px`;
     }
 
     async extractSelectedText() {
@@ -651,11 +808,25 @@ class PDFViewer {
         return a.x1 < b.x2 && a.x2 > b.x1 && a.y1 < b.y2 && a.y2 > b.y1;
     }
 
+    getPageScale() {
+        // Screen pixels per PDF point for the currently displayed page image
+        if (!this.pageDimensions) return null;
+
+        const img = document.getElementById('page-image');
+        if (!img?.clientWidth || !img?.clientHeight) return null;
+
+        return {
+            x: img.clientWidth / this.pageDimensions.width,
+            y: img.clientHeight / this.pageDimensions.height
+        };
+    }
+
     screenToPdfCoords(screenRect) {
         if (!this.pageDimensions) return screenRect;
 
-        const scaleX = this.pageDimensions.width / (document.getElementById('page-image')?.clientWidth || 1);
-        const scaleY = this.pageDimensions.height / (document.getElementById('page-image')?.clientHeight || 1);
+        const scale = this.getPageScale();
+        const scaleX = scale ? 1 / scale.x : this.pageDimensions.width;
+        const scaleY = scale ? 1 / scale.y : this.pageDimensions.height;
 
         return {
             x1: screenRect.x1 * scaleX,
@@ -672,40 +843,30 @@ class PDFViewer {
         const menu = document.createElement('div');
         menu.className = 'selection-menu';
         menu.id = 'selection-menu';
-        menu.style.left = `${x}px`;
-        menu.style.top = `${y}px`;
-
-        const actions = [
-            { label: 'Explain', action: 'explain' },
-            { label: 'Summarize', action: 'summarize' },
-            { label: 'Translate', action: 'translate' },
-            { label: 'Define', action: 'define' },
-            { label: 'Ask AI', action: 'ask' },
-            { label: 'Take a Note', action: 'take_note' }
-        ];
-
-        actions.forEach(({ label, action }) => {
+
+        SELECTION_ACTIONS.forEach(({ label, action }) => {
             const item = document.createElement('div');
             item.className = 'selection-menu-item';
             item.dataset.action = action;
             item.textContent = label;
-            item.addEventListener('click', () => {
-                this.handleSelectionAction(action);
-                this.hideSelectionMenu();
-            });
             menu.appendChild(item);
         });
+        menu.addEventListener('click', (e) => {
+            const item = e.target.closest('.selection-menu-item');
+            if (!item) return;
+            this.handleSelectionAction(item.dataset.action);
+            this.hideSelectionMenu();
+        });
 
         document.body.appendChild(menu);
 
-        // Adjust position if menu goes off screen
-        const menuRect = menu.getBoundingClientRect();
-        if (menuRect.right > window.innerWidth) {
-            menu.style.left = `${x - menuRect.width}px`;
-        }
-        if (menuRect.bottom > window.innerHeight) {
-            menu.style.top = `${y - menuRect.height}px`;
-        }
+        // Flip away from the viewport edges and clamp in one pass, then
+        // write the final position once.
+        const { width, height } = menu.getBoundingClientRect();
+        const left = x + width > window.innerWidth ? x - width : x;
+        const top = y + height > window.innerHeight ? y - height : y;
+        menu.style.left = `${Math.max(0, Math.min(left, window.innerWidth - width))}px`;
+        menu.style.top = `${Math.max(0, Math.min(top, window.innerHeight - height))}px`;
     }
 
     hideSelectionMenu() {
@@ -760,8 +921,6 @@ class PDFViewer {
         if (layer) {
             // Only remove selection elements, preserve OCR spans
             layer.querySelectorAll('.selection-highlight').forEach(el => el.remove());
-            const menu = layer.querySelector('#selection-menu');
-            if (menu) menu.remove();
         }
     }
 
@@ -772,19 +931,15 @@ class PDFViewer {
         const isProcessing = this.ocrPageLoadingPage === this.currentPage;
         const isProcessed = this.ocrDocumentFullyProcessed || !!this.ocrResults[this.currentPage] || this.ocrCachedPages?.has(this.currentPage);
 
+        const state = isProcessing ? 'processing' : isProcessed ? 'processed' : 'idle';
+        // Progress polling calls this repeatedly; leave the DOM alone unless
+        // the status actually changed.
+        if (statusEl.dataset.state === state) return;
+        statusEl.dataset.state = state;
+
         statusEl.classList.remove('idle', 'processing', 'processed');
-        if (isProcessing) {
-            statusEl.textContent = 'OCR: Processing...';
-            statusEl.classList.add('processing');
-            return;
-        }
-        if (isProcessed) {
-            statusEl.textContent = 'OCR: Processed';
-            statusEl.classList.add('processed');
-            return;
-        }
-        statusEl.textContent = 'OCR: Not Processed';
-        statusEl.classList.add('idle');
+        statusEl.classList.add(state);
+        statusEl.textContent = OCR_STATUS_LABELS[state];
     }
 
     getCurrentPage() {
@@ -832,23 +987,17 @@ class PDFViewer {
         };
     }
 
-    pdfToScreenCoords(pdfRect) {
-        if (!this.pageDimensions) return null;
-
-        const img = document.getElementById('page-image');
-        if (!img?.clientWidth || !img?.clientHeight) return null;
-
-        const scaleX = img.clientWidth / this.pageDimensions.width;
-        const scaleY = img.clientHeight / this.pageDimensions.height;
+    pdfToScreenCoords(pdfRect, scale = this.getPageScale()) {
+        if (!scale) return null;
 
         const rect = this.normalizeRect(pdfRect);
         if (!rect) return null;
 
         return {
-            x1: rect.x1 * scaleX,
-            y1: rect.y1 * scaleY,
-            x2: rect.x2 * scaleX,
-            y2: rect.y2 * scaleY
+            x1: rect.x1 * scale.x,
+            y1: rect.y1 * scale.y,
+            x2: rect.x2 * scale.x,
+            y2: rect.y2 * scale.y
         };
     }
 
@@ -871,11 +1020,11 @@ class PDFViewer {
         }, 2200);
     }
 
-    renderNoteFocusHighlight(rectPdf) {
+    renderNoteFocusHighlight(rectPdf, scale = this.getPageScale()) {
         const layer = document.getElementById('selection-layer');
         if (!layer) return;
 
-        const rect = this.pdfToScreenCoords(rectPdf);
+        const rect = this.pdfToScreenCoords(rectPdf, scale);
         if (!rect) return;
 
         layer.querySelectorAll('.note-focus-highlight').forEach(el => el.remove());
@@ -1151,22 +1300,20 @@ class PDFViewer {
         }
     }
 
-    renderOcrOverlay(lines) {
+    renderOcrOverlay(lines, scale = this.getPageScale()) {
         this.clearOcrOverlay();
 
-        if (!lines || !lines.length || !this.pageDimensions) return;
+        if (!lines || !lines.length || !scale) return;
 
         const layer = document.getElementById('selection-layer');
-        const img = document.getElementById('page-image');
-        if (!layer || !img) return;
+        if (!layer) return;
 
-        const imgWidth = img.clientWidth;
-        const imgHeight = img.clientHeight;
-        const pageWidth = this.pageDimensions.width;
         const pageHeight = this.pageDimensions.height;
-        const scaleX = imgWidth / pageWidth;
-        const scaleY = imgHeight / pageHeight;
+        const scaleX = scale.x;
+        const scaleY = scale.y;
 
+        // Build every span off-document and attach them in one insertion
+        const fragment = document.createDocumentFragment();
         for (const line of lines) {
             const span = document.createElement('span');
             span.className = 'ocr-text-span';
@@ -1185,8 +1332,9 @@ class PDFViewer {
             span.style.height = `${screenH}px`;
             span.style.fontSize = `${screenH * 0.85}px`;
 
-            layer.appendChild(span);
+            fragment.appendChild(span);
         }
+        layer.appendChild(fragment);
     }
 
     clearOcrOverlay() {
@@ -1210,7 +1358,6 @@ class PDFViewer {
 
         // Navigate to first result
         const firstPage = results.length > 0 ? results[0].page : 0;
-        this.searchCurrentPage = firstPage;
         if (firstPage && firstPage !== this.currentPage) {
             this.goToPage(firstPage);
         } else {
@@ -1218,7 +1365,7 @@ class PDFViewer {
         }
     }
 
-    renderSearchHighlights() {
+    renderSearchHighlights(scale = null) {
         const layer = document.getElementById('selection-layer');
         if (!layer) return;
 
@@ -1227,8 +1374,12 @@ class PDFViewer {
         const rects = this.searchHighlights[this.currentPage];
         if (!rects || !rects.length) return;
 
+        scale = scale || this.getPageScale();
+        if (!scale) return;
+
+        const fragment = document.createDocumentFragment();
         for (const pdfRect of rects) {
-            const screen = this.pdfToScreenCoords(pdfRect);
+            const screen = this.pdfToScreenCoords(pdfRect, scale);
             if (!screen) continue;
 
             const el = document.createElement('div');
@@ -1237,13 +1388,17 @@ class PDFViewer {
             el.style.top = `${screen.y1}px`;
             el.style.width = `${screen.x2 - screen.x1}px`;
             el.style.height = `${screen.y2 - screen.y1}px`;
-            layer.appendChild(el);
+            fragment.appendChild(el);
         }
+        layer.appendChild(fragment);
     }
 
     clearSearchHighlights() {
+        // Editing an already-empty search box lands here on every keystroke;
+        // with nothing highlighted there is nothing to reset or remove.
+        if (!Object.keys(this.searchHighlights).length) return;
+
         this.searchHighlights = {};
-        this.searchCurrentPage = 0;
         const layer = document.getElementById('selection-layer');
         if (layer) {
             layer.querySelectorAll('.search-highlight').forEach(el => el.remove());
@@ -13,13 +13,6 @@ from pathlib import Path
 # Add the project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-try:
-    import webview
-except ImportError:
-    print("Error: pywebview is not installed.")
-    print("Install it with: pip install pywebview")
-    sys.exit(1)
-
 from backend import DeepReadAPI
 
 
@@ -115,6 +108,14 @@ def main():
     """Main entry point."""
     _configure_packaged_runtime_env()
 
+    # Imported here so that importing this module does not load the GUI toolkit
+    try:
+        import webview
+    except ImportError:
+        print("Error: pywebview is not installed.")
+        print("Install it with: pip install pywebview")
+        sys.exit(1)
+
     print("Starting DeepRead AI...")
     print("=" * 50)
 
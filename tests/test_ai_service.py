@@ -193,6 +193,21 @@ class TestChatSession:
         # system + 2*max_turns history + current user = 1 + 4 + 1 = 6
         assert len(msgs) == 6
 
+    def test_history_keeps_only_recent_turns(self):
+        session = ChatSession("sys", max_turns=2)
+        for i in range(5):
+            session.add("user", f"q{i}")
+            session.add("assistant", f"a{i}")
+        assert [m.content for m in session._history] == ["q3", "a3", "q4", "a4"]
+
+    def test_zero_max_turns_keeps_full_history(self):
+        session = ChatSession("sys", max_turns=0)
+        for i in range(5):
+            session.add("user", f"q{i}")
+            session.add("assistant", f"a{i}")
+        msgs = session.build_messages("new")
+        assert len(msgs) == 12
+
     def test_clear_empties_history(self):
         session = ChatSession("sys")
         session.add("user", "msg")
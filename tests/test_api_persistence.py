@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
+import os
 import sqlite3
 from pathlib import Path
 
 import backend.api as api_module
 import backend.engine_factory as engine_factory_module
 from backend.persistence import PersistenceStore
+from backend.render_cache import file_content_id
 
 
 class FakePDFEngine:
     """Minimal stub for API-level persistence tests."""
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, disk_cache=None):
         self.file_path = file_path
         self.page_count = 12
+        self.content_id = file_content_id(file_path)
 
     def close(self):
         return None
 
+    def get_page_size(self, page_num: int) -> tuple[float, float]:
+        return (600.0 + page_num, 800.0)
+
     def get_metadata(self) -> dict:
         return {
             "file_name": Path(self.file_path).name,
@@ -32,6 +38,7 @@ class FakePDFEngine:
 
 def _make_api(monkeypatch, db_path: Path):
     monkeypatch.setenv("DEEPREAD_DB_PATH", str(db_path))
+    monkeypatch.setenv("DEEPREAD_CACHE_DIR", str(db_path.parent / "render_cache"))
     monkeypatch.setattr(api_module, "PDFEngine", FakePDFEngine)
     monkeypatch.setattr(engine_factory_module, "PDFEngine", FakePDFEngine)
     return api_module.DeepReadAPI()
@@ -87,6 +94,7 @@ def test_session_state_restored_after_restart(monkeypatch, tmp_path):
     assert reopened["session_state"]["last_zoom"] == 1.75
     assert reopened["session_state"]["ocr_enabled"] is True
     assert reopened["session_state"]["ocr_mode"] == "document"
+    assert (reopened["page_width"], reopened["page_height"]) == (607.0, 800.0)
 
 
 def test_page_notes_persist_after_restart(monkeypatch, tmp_path):
@@ -238,6 +246,72 @@ def test_recent_files_prunes_missing_paths(monkeypatch, tmp_path):
     assert recent["files"] == []
 
 
+def test_ocr_fingerprint_ignores_mtime(monkeypatch, tmp_path):
+    db_path = tmp_path / "deepread.db"
+    file_path = tmp_path / "scanned.pdf"
+    _touch(file_path)
+
+    api = _make_api(monkeypatch, db_path)
+    assert api.open_pdf(str(file_path))["success"]
+    fingerprint = api._ocr_fingerprint
+    os.utime(file_path, ns=(1, 1))
+    assert api.open_pdf(str(file_path))["success"]
+
+    assert api._ocr_fingerprint == fingerprint
+    assert fingerprint.endswith(f":{file_path.stat().st_size}")
+
+
+def test_batch_runs_calls_in_order(monkeypatch, tmp_path):
+    db_path = tmp_path / "deepread.db"
+    file_path = tmp_path / "batched.pdf"
+    _touch(file_path)
+
+    api = _make_api(monkeypatch, db_path)
+    assert api.open_pdf(str(file_path))["success"]
+
+    result = api.batch([
+        {"method": "get_recent_files", "args": [5]},
+        {"method": "get_app_info"},
+        {"method": "_get_version"},
+        {"method": "batch", "args": [[]]},
+        {"method": "get_page", "args": [1, 1.0, "extra"]},
+        {"method": "get_recent_files", "args": {"limit": 5}},
+        {"method": "get_recent_files", "args": "5"},
+    ])
+
+    assert result["success"]
+    recent, info, private, nested, bad_args, dict_args, str_args = result["results"]
+    assert dict_args == {"success": False, "error": "args must be a list"}
+    assert str_args == dict_args
+    assert [item["file_path"] for item in recent["files"]] == [str(file_path.resolve())]
+    assert info["name"] == "DeepRead AI"
+    assert private == {"success": False, "error": "Unknown method: _get_version"}
+    assert nested == {"success": False, "error": "Unknown method: batch"}
+    assert not bad_args["success"]
+    assert not api.batch("get_app_info")["success"]
+
+
+def test_batch_saves_notes_and_session_state(monkeypatch, tmp_path):
+    db_path = tmp_path / "deepread.db"
+    file_path = tmp_path / "flush.pdf"
+    _touch(file_path)
+
+    api = _make_api(monkeypatch, db_path)
+    assert api.open_pdf(str(file_path))["success"]
+    note = {"id": "n1", "page": 3, "quote": "q", "note": "", "rectPdf": {"x1": 1, "y1": 1, "x2": 2, "y2": 2}}
+    state = {"last_page": 3, "last_zoom": 1.5, "ocr_enabled": False, "ocr_mode": "page"}
+
+    result = api.batch([
+        {"method": "save_page_notes", "args": [str(file_path), [note]]},
+        {"method": "save_session_state", "args": [str(file_path), state]},
+    ])
+
+    assert all(item["success"] for item in result["results"])
+    reopened = api.open_pdf(str(file_path))
+    assert [item["id"] for item in reopened["page_notes"]] == ["n1"]
+    assert reopened["session_state"]["last_page"] == 3
+
+
 def test_persistence_migrates_legacy_documents_schema(tmp_path):
     db_path = tmp_path / "legacy.db"
     conn = sqlite3.connect(db_path)
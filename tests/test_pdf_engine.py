@@ -0,0 +1,94 @@
+"""Tests for the PDF rendering engine."""
+
+import fitz
+import pytest
+
+from backend.pdf_engine import PDFEngine
+from backend.render_cache import DiskRenderCache
+
+
+class TestPDFEngine:
+    """Test cases for PDFEngine."""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        path = tmp_path / "sample.pdf"
+        doc = fitz.open()
+        for text in ("Hello selection", "Page 2", "Page 3"):
+            page = doc.new_page(width=300, height=200)
+            page.insert_text((50, 60), text, fontsize=12)
+        doc.save(str(path))
+        doc.close()
+
+        PDFEngine._render_cache.clear()
+        engine = PDFEngine(str(path))
+        yield engine
+        engine.close()
+
+    def test_extract_text_from_rect(self, engine):
+        rect = {"x1": 40, "y1": 40, "x2": 250, "y2": 70}
+
+        assert engine.extract_text(1, rect).strip() == "Hello selection"
+        assert engine.extract_text(2, rect).strip() == "Page 2"
+        assert engine.extract_text(1, {**rect, "x2": 250.01}).strip() == "Hello selection"
+        assert len(engine._clip_text) == 2
+
+    @pytest.mark.parametrize("rect", [
+        {"x1": 50, "y1": 50, "x2": 51, "y2": 70},
+        {"x1": 40, "y1": 55, "x2": 250, "y2": 55},
+        {"x1": 250, "y1": 70, "x2": 40, "y2": 40},
+    ])
+    def test_extract_text_ignores_degenerate_rect(self, engine, rect):
+        assert engine.extract_text(1, rect) == ""
+
+    def test_extract_text_rejects_invalid_page(self, engine):
+        with pytest.raises(ValueError):
+            engine.extract_text(4, {"x1": 0, "y1": 0, "x2": 10, "y2": 10})
+
+    def test_render_page_reuses_cached_image(self, engine):
+        first = engine.render_page(1, 1.0)
+
+        assert engine.render_page(1, 1.001) is first
+        assert not engine.is_rendered(1, 1.5)
+
+    def test_reopened_document_reuses_renders(self, engine):
+        first = engine.render_page(1, 1.0)
+
+        with PDFEngine(engine.file_path) as reopened:
+            assert reopened.content_id == engine.content_id
+            assert reopened.render_page(1, 1.0) is first
+
+    def test_prefetch_pages_fills_cache(self, engine):
+        engine.render_page(1, 1.0)
+
+        assert engine.prefetch_pages([2, 0, 4, 1], 1.0)
+        assert engine.wait_for_prefetch(timeout=5)
+
+        assert engine.is_rendered(2, 1.0)
+        assert not engine.is_rendered(3, 1.0)
+        assert not engine.prefetch_pages([1, 2], 1.0)
+
+    def test_prefetch_reuses_one_worker(self, engine):
+        with PDFEngine(engine.file_path) as other:
+            other.prefetch_pages([2], 1.0)
+            worker = other._prefetch_thread
+            other.wait_for_prefetch(timeout=5)
+            other.prefetch_pages([3], 1.0)
+            other.wait_for_prefetch(timeout=5)
+
+            assert other._prefetch_thread is worker
+            assert other.is_rendered(3, 1.0)
+
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+
+    def test_render_page_falls_back_to_disk_cache(self, engine, tmp_path):
+        disk_cache = DiskRenderCache(tmp_path / "renders")
+        with PDFEngine(engine.file_path, disk_cache=disk_cache) as cached:
+            first = cached.render_page(1, 1.0)
+            disk_cache.flush()
+            PDFEngine._render_cache.clear()
+
+            assert list((tmp_path / "renders" / cached.content_id).glob("*.png"))
+            assert cached.render_page(1, 1.0) == first
+        assert engine.disk_cache is None
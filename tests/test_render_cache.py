@@ -0,0 +1,113 @@
+"""Tests for the rendered page LRU cache."""
+
+import os
+
+from backend.render_cache import DiskRenderCache, RenderCache, default_cache_dir, file_content_id
+
+
+class TestRenderCache:
+    """Test cases for RenderCache."""
+
+    def test_evicts_least_recently_used(self):
+        cache = RenderCache(max_entries=2)
+        cache.put((1, 1.0), "one")
+        cache.put((2, 1.0), "two")
+
+        assert cache.get((1, 1.0)) == "one"
+        cache.put((3, 1.0), "three")
+
+        assert (2, 1.0) not in cache
+        assert cache.get((1, 1.0)) == "one"
+        assert cache.get((3, 1.0)) == "three"
+        assert len(cache) == 2
+
+    def test_evicts_to_stay_within_byte_budget(self):
+        cache = RenderCache(max_bytes=10)
+        cache.put((1, 1.0), "aaaa")
+        cache.put((2, 1.0), "bbbb")
+        cache.put((2, 1.0), "cccc")
+        assert cache.size_bytes == 8
+
+        cache.put((3, 1.0), "dddd")
+        assert (1, 1.0) not in cache
+        assert cache.size_bytes == 8
+
+        cache.put((4, 1.0), "x" * 20)
+        assert len(cache) == 1
+        assert cache.size_bytes == 20
+
+    def test_missing_key_returns_none(self):
+        cache = RenderCache()
+
+        assert cache.get((1, 1.0)) is None
+        cache.put((1, 1.0), "one")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
+
+
+def test_file_content_id_changes_with_mtime(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.7\n" + b"x" * 200_000)
+    original = file_content_id(str(path))
+
+    assert file_content_id(str(path)) == original
+    os.utime(path, ns=(1, 1))
+    assert file_content_id(str(path)) != original
+
+
+def test_default_cache_dir_honours_platform_cache_location(monkeypatch, tmp_path):
+    monkeypatch.setattr(os, "name", "posix")
+    monkeypatch.setattr("sys.platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert default_cache_dir("BetterPDF") == tmp_path / "BetterPDF"
+
+
+class TestDiskRenderCache:
+    """Test cases for DiskRenderCache."""
+
+    def test_counts_files_from_earlier_sessions(self, tmp_path):
+        (tmp_path / "old").mkdir()
+        (tmp_path / "old" / "1_1.00.png").write_bytes(b"x" * 10)
+        os.utime(tmp_path / "old" / "1_1.00.png", (1, 1))
+        cache = DiskRenderCache(tmp_path, max_bytes=15)
+
+        cache.put("doc", 1, 1.0, b"x" * 10)
+        cache.flush()
+
+        assert cache.get("old", 1, 1.0) is None
+        assert cache.get("doc", 1, 1.0) is not None
+
+    def test_roundtrip(self, tmp_path):
+        cache = DiskRenderCache(tmp_path)
+
+        assert cache.get("doc", 1, 1.0) is None
+        cache.put("doc", 1, 1.0, b"png-bytes")
+        cache.flush()
+        assert cache.get("doc", 1, 1.0) == b"png-bytes"
+        assert cache.get("doc", 1, 1.5) is None
+
+    def test_overwrite_does_not_inflate_size(self, tmp_path):
+        cache = DiskRenderCache(tmp_path, max_bytes=25)
+        cache.put("doc", 1, 1.0, b"x" * 10)
+        for _ in range(5):
+            cache.put("doc", 2, 1.0, b"x" * 10)
+        cache.flush()
+
+        assert cache._bytes == 20
+        assert cache.get("doc", 1, 1.0) is not None
+
+    def test_evicts_oldest_files_over_budget(self, tmp_path):
+        cache = DiskRenderCache(tmp_path, max_bytes=25)
+        cache.put("doc", 1, 1.0, b"x" * 10)
+        cache.put("doc", 2, 1.0, b"x" * 10)
+        cache.flush()
+        os.utime(tmp_path / "doc" / "1_1.00.png", (1, 1))
+
+        cache.put("doc", 3, 1.0, b"x" * 10)
+        cache.flush()
+
+        assert cache.get("doc", 1, 1.0) is None
+        assert cache.get("doc", 2, 1.0) is not None
+        assert cache.get("doc", 3, 1.0) is not None
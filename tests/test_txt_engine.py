@@ -0,0 +1,79 @@
+"""Tests for the plain-text rendering engine."""
+
+import textwrap
+
+import pytest
+
+from backend.render_cache import SHARED_RENDER_CACHE
+from backend.txt_engine import TextEngine
+
+
+def _reference_lines(content: str, width: int) -> list[str]:
+    lines = []
+    for line in content.split("\n"):
+        wrapped = textwrap.wrap(
+            line,
+            width=width,
+            break_long_words=True,
+            break_on_hyphens=False,
+            replace_whitespace=False,
+        )
+        lines.extend(wrapped or [""])
+    return lines
+
+
+class TestTextEngine:
+    """Test cases for TextEngine."""
+
+    @pytest.fixture
+    def write_text(self, tmp_path):
+        def _write(content: str) -> str:
+            path = tmp_path / "sample.txt"
+            path.write_text(content, encoding="utf-8")
+            return str(path)
+        return _write
+
+    def test_pagination_matches_textwrap(self, write_text):
+        content = "\n".join([
+            "short line",
+            "",
+            "   indented line",
+            "trailing spaces   ",
+            "\t tabbed",
+            "   ",
+            "中文内容" * 30,
+            "word " * 40,
+        ] * 20)
+        engine = TextEngine(write_text(content))
+
+        paged = [line for page in engine._pages for line in page]
+        assert paged == _reference_lines(content, TextEngine.CHARS_PER_LINE)
+        engine.close()
+
+    def test_search_text_locates_matches(self, write_text):
+        engine = TextEngine(write_text("alpha beta\nGamma BETA delta\n"))
+
+        results = engine.search_text("beta")
+
+        assert [r["page"] for r in results] == [1, 1]
+        first, second = (r["rect"] for r in results)
+        assert first["y1"] == TextEngine.MARGIN_TOP
+        assert second["y1"] == TextEngine.MARGIN_TOP + TextEngine.LINE_HEIGHT
+        assert second["x1"] == pytest.approx(
+            TextEngine.MARGIN_LEFT + 6 * TextEngine.FONT_SIZE * 0.6
+        )
+        assert engine.search_text("missing") == []
+        engine.close()
+
+    def test_render_page_reuses_scaled_font(self, write_text):
+        engine = TextEngine(write_text("alpha\n"))
+
+        engine.render_page(1, 1.5)
+        font = engine._scaled_fonts[int(TextEngine.FONT_SIZE * 1.5)]
+        engine.render_page(1, 1.25)
+        SHARED_RENDER_CACHE.clear()
+        engine.render_page(1, 1.5)
+
+        assert engine._scaled_fonts[int(TextEngine.FONT_SIZE * 1.5)] is font
+        assert len(engine._scaled_fonts) == 2
+        engine.close()